@@ -168,9 +168,10 @@ class MongoBSONRegEx(ctypes.Structure):
     @classmethod
     def unpack_from(cls, val: gdb.Value, /, *, view: memoryview) -> "MongoBSONRegEx":
         """Read two null-terminated strings starting from the beginning of the given buffer."""
-        pattern = MongoStringData.from_cstring(val, maxsize=len(view))
+        pattern = MongoStringData.from_cstring(val, maxsize=len(view), view=view)
         offset = pattern.size.value + 1
-        flags = MongoStringData.from_cstring(val + offset, maxsize=len(view) - offset)
+        flags = MongoStringData.from_cstring(val + offset, maxsize=len(view) - offset,
+                                             view=view[offset:])
         return cls(pattern=pattern, flags=flags)
 
     def to_value(self) -> gdb.Value:
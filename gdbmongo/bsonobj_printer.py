@@ -168,7 +168,7 @@ def invalid_bson(_val: gdb.Value, view: memoryview, /) -> typing.Tuple[gdb.Value
 
 def unpack_cstring(val: gdb.Value, view: memoryview, /) -> typing.Tuple[gdb.Value, int]:
     """Read a null-terminated string starting from the beginning of the given buffer."""
-    string_data = MongoStringData.from_cstring(val, maxsize=len(view))
+    string_data = MongoStringData.from_cstring(val, maxsize=len(view), view=view)
     return (string_data.to_value(), string_data.size.value + 1)
 
 
@@ -220,8 +220,7 @@ def unpack_undefined(_val: gdb.Value, _view: memoryview, /) -> typing.Tuple[gdb.
 
 def unpack_object_id(_val: gdb.Value, view: memoryview, /) -> typing.Tuple[gdb.Value, int]:
     """Read a 12-byte ObjectId starting from the beginning of the given buffer."""
-    object_id = MongoOID.unpack_from(view)
-    return (object_id.to_value(), 12)
+    return (MongoOID.value_from(view), 12)
 
 
 def unpack_bool(_val: gdb.Value, view: memoryview, /) -> typing.Tuple[gdb.Value, int]:
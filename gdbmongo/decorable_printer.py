@@ -35,6 +35,7 @@ import typing
 import gdb
 
 from gdbmongo import stdlib_printers, stdlib_xmethods
+from gdbmongo.gdbutil import gdb_address_of
 from gdbmongo.printer_protocol import PrettyPrinterProtocol
 
 
@@ -65,7 +66,7 @@ class DecorationMemoryPrinterBase(PrettyPrinterProtocol, collections.abc.Sized):
     def children(self) -> typing.Iterator[typing.Tuple[str, gdb.Value]]:
         for (index, (decoration_type, decoration_value)) in enumerate(self._iterate_raw_entries()):
             decoration_type_p = decoration_type.pointer()
-            decoration_address = decoration_value.address
+            decoration_address = gdb_address_of(decoration_value)
 
             # decoration_value.cast(decoration_type) may not be an addressable object so we get its
             # address and perform the cast through the unsigned char* representation of the value.
@@ -143,7 +144,7 @@ class DecorationContainerPrinter(DecorationMemoryPrinterBase):
         # https://gcc.gnu.org/bugzilla/show_bug.cgi?id=77990 and is therefore present in all
         # versions of the libstdc++ pretty printers for the MongoDB toolchain. We pass in
         # `obj.address` to UniquePtrGetWorker to cancel out the obj.dereference() call.
-        decorations_storage = xmethod_worker(self.decorations_storage.address)
+        decorations_storage = xmethod_worker(gdb_address_of(self.decorations_storage))
         iterator = stdlib_printers.StdVectorPrinter("std::vector", self.decorations_info).children()
         for (index, (_, decoration_info)) in enumerate(iterator):
             storage_offset = int(decoration_info["descriptor"]["_index"])
@@ -152,7 +153,7 @@ class DecorationContainerPrinter(DecorationMemoryPrinterBase):
             assert index < len(self._decorations_type)
             if (decoration_type := self._decorations_type[index]) is None:
                 type_name = self._get_decoration_type_name(decoration_info)
-                decoration_address = int(decoration_value.address)
+                decoration_address = int(gdb_address_of(decoration_value))
                 decoration_type = self._cast_decoration_value(type_name, decoration_address).type
                 self._decorations_type[index] = decoration_type
 
@@ -161,7 +162,7 @@ class DecorationContainerPrinter(DecorationMemoryPrinterBase):
     def _get_decoration_type_name(self, decoration_info: gdb.Value, /) -> str:
         """Return the name of the decoration type."""
         function = decoration_info["constructor"]
-        address = int(function.dereference().address)
+        address = int(gdb_address_of(function.dereference()))
 
         if address == 0:
             # The changes from SERVER-76788 made it possible for the constructor function to be
@@ -277,7 +278,7 @@ class DecorationBufferPrinter(DecorationMemoryPrinterBase):
             assert index < len(self._decorations_type)
             if (decoration_type := self._decorations_type[index]) is None:
                 type_name = self._get_decoration_type_name(entry)
-                decoration_address = int(decoration_value.address)
+                decoration_address = int(gdb_address_of(decoration_value))
                 decoration_type = self._cast_decoration_value(type_name, decoration_address).type
                 self._decorations_type[index] = decoration_type
 
@@ -15,19 +15,109 @@
 ###
 """Utility functions for gdb.Types and gdb.Values."""
 
+import functools
 import typing
 
 import gdb
 
 
+def gdb_invalidate_on_objfile_change(cache_clear: typing.Callable[[], None], /) -> None:
+    """Arrange for the given function to be called whenever GDB loads or discards an objfile.
+
+    Symbols and types found by GDB belong to the objfile they were read from. Any cache of them must
+    therefore be emptied once a different executable, shared library, or core dump is loaded.
+    """
+    gdb.events.new_objfile.connect(lambda _event: cache_clear())
+    gdb.events.clear_objfiles.connect(lambda _event: cache_clear())
+
+
+def gdb_invalidate_on_resume(cache_clear: typing.Callable[[], None], /) -> None:
+    """Arrange for the given function to be called whenever the inferior is about to resume.
+
+    Any cache of data read from the inferior's memory must be emptied before the program runs again
+    because the data may have since been modified.
+    """
+    gdb.events.cont.connect(lambda _event: cache_clear())
+
+
+@functools.lru_cache(maxsize=None)
+def _gdb_lookup_symbol(symbol_name: str, /) -> typing.Optional[gdb.Symbol]:
+    """Return the gdb.Symbol corresponding to the symbol name given.
+
+    gdb.lookup_symbol() scales with the number of objfiles and is slow for dynamically-linked
+    executables. The gdb.Symbol is cached rather than its gdb.Value because the contents of the
+    gdb.Value would otherwise go stale while debugging a live process.
+    """
+    return gdb.lookup_symbol(symbol_name)[0]
+
+
+gdb_invalidate_on_objfile_change(_gdb_lookup_symbol.cache_clear)
+
+
 def gdb_lookup_value(symbol_name: str, /) -> typing.Optional[gdb.Value]:
     """Return the gdb.Value corresponding to the symbol name given."""
-    if (symbol := gdb.lookup_symbol(symbol_name)[0]) is not None:
+    if (symbol := _gdb_lookup_symbol(symbol_name)) is not None:
         return symbol.value()
 
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def gdb_lookup_type(typename: str, /) -> gdb.Type:
+    """Return the gdb.Type corresponding to the type name given.
+
+    This function caches the result of gdb.lookup_type() because it is called for every value
+    printed by some of the pretty printers. A gdb.error is still raised when the type doesn't exist.
+    """
+    return gdb.lookup_type(typename)
+
+
+gdb_invalidate_on_objfile_change(gdb_lookup_type.cache_clear)
+
+
+@functools.lru_cache(maxsize=None)
+def gdb_is_type_defined(typename: str, /) -> bool:
+    """Return True if the struct, class, union, or enum type given is defined, and return False
+    otherwise.
+
+    Unlike gdb_lookup_type(), this function doesn't rely on gdb.lookup_type() raising a gdb.error to
+    discover the type is missing except when no frame is selected.
+    """
+    try:
+        return gdb.lookup_symbol(typename, domain=gdb.SYMBOL_STRUCT_DOMAIN)[0] is not None
+    except gdb.error as err:
+        # gdb.lookup_symbol() searches from the selected frame's block and so cannot be used at the
+        # prompt when there isn't a live process or core dump. gdb.lookup_type() has no such
+        # requirement.
+        if not err.args[0].startswith("No frame selected"):
+            raise
+
+    try:
+        gdb_lookup_type(typename)
+        return True
+    except gdb.error as err:
+        if not err.args[0].startswith("No type named "):
+            raise
+
+        return False
+
+
+gdb_invalidate_on_objfile_change(gdb_is_type_defined.cache_clear)
+
+
+def gdb_address_of(val: gdb.Value, /) -> gdb.Value:
+    """Return the address of the value.
+
+    gdb.Value.address is None for values which don't live in the inferior's memory, such as those
+    constructed from a Python buffer. This function is for the common case of a value having been
+    read from the inferior and raises a gdb.error otherwise.
+    """
+    if (address := val.address) is None:
+        raise gdb.error("Attempt to take address of value not located in memory.")
+
+    return address
+
+
 def gdb_resolve_type(typ: gdb.Type, /) -> gdb.Type:
     """Look up the name of a C++ type with any typedefs, pointers, and references stripped.
 
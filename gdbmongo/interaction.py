@@ -83,7 +83,7 @@ def _set_thread_names(all_threads: typing.Tuple[gdb.InferiorThread, ...], /) ->
             if thread_name := thread_name_printer.get_thread_name():
                 thread.name = thread_name
     finally:
-        if original_thread.is_valid():
+        if original_thread is not None and original_thread.is_valid():
             original_thread.switch()
             if original_frame.is_valid():
                 original_frame.select()
@@ -25,6 +25,7 @@ core file can be displayed with the following commands:
 """
 
 import abc
+import functools
 import struct
 import typing
 
@@ -34,13 +35,23 @@ from gdbmongo import stdlib_printers, stdlib_xmethods
 from gdbmongo.abseil_printers import (AbslFlatHashMapPrinter, AbslNodeHashMapPrinter,
                                       AbslFlatHashSetPrinter, AbslNodeHashSetPrinter)
 from gdbmongo.decorable_printer import DecorationIterator
-from gdbmongo.gdbutil import gdb_is_libthread_db_loaded, gdb_lookup_value
+from gdbmongo.gdbutil import (gdb_address_of, gdb_invalidate_on_objfile_change,
+                              gdb_invalidate_on_resume, gdb_is_libthread_db_loaded,
+                              gdb_is_type_defined, gdb_lookup_type, gdb_lookup_value)
 from gdbmongo.printer_protocol import (PrettyPrinterProtocol, SupportsChildren, SupportsDisplayHint,
                                        SupportsToString)
 from gdbmongo.static_immortal_printer import StaticImmortalPrinter
 from gdbmongo.string_data_printer import StdStringPrinter
 
 
+def _address_of(val: gdb.Value, /) -> int:
+    """Return the address of the object, or the address the object points to if it is a pointer."""
+    if val.type.strip_typedefs().code == gdb.TYPE_CODE_PTR:
+        return int(val)
+
+    return int(gdb_address_of(val))
+
+
 class ServiceContextDecorationMixin(typing.Protocol):
     """Class to add support for constructing from the global ServiceContext if the subclass already
     supports constructing from a ServiceContext explicitly.
@@ -91,18 +102,25 @@ class CollectionCatalogGetter(typing.Protocol):
 class _CollectionCatalogPrinter(ServiceContextDecorationMixin, ResourceCatalogGetter):
     """Pretty-printer for mongo::CollectionCatalog."""
 
+    _cached_printers: typing.ClassVar[typing.Dict[int, "_CollectionCatalogPrinter"]] = {}
+    """Mapping from the mongo::ServiceContext address to the printer for its CollectionCatalog."""
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.resources = val["_resourceInformation"]
         self.val = val
 
+        # The std::map is walked once here so looking up the name of each ResourceId in a
+        # LockManager dump is a dictionary access rather than another walk of the std::map.
+        self._by_id: typing.Dict[int, gdb.Value] = {}
+        iterator = stdlib_printers.StdMapPrinter("std::map", self.resources).children()
+        for (_, iter_res_id) in iterator:
+            # The std::map printer yields the key and the value of each entry as separate children.
+            (_, iter_nss_set) = next(iterator)
+            self._by_id[int(iter_res_id["_fullHash"])] = iter_nss_set
+
     def lookup_resource_name(self, res_id: gdb.Value, /) -> typing.Optional[str]:
         """Return the database or collection namespace string of the resource."""
-        iterator = stdlib_printers.StdMapPrinter("std::map", self.resources).children()
-        for ((_, iter_res_id), (_, iter_nss_set)) in zip(iterator, iterator):
-            if iter_res_id == res_id:
-                nss_set = iter_nss_set
-                break
-        else:
+        if (nss_set := self._by_id.get(int(res_id["_fullHash"]))) is None:
             return None
 
         namespaces = [
@@ -117,7 +135,7 @@ class _CollectionCatalogPrinter(ServiceContextDecorationMixin, ResourceCatalogGe
         short_name = "LatestCollectionCatalog"
 
         def __init__(self) -> None:
-            self.catalog_type = gdb.lookup_type(
+            self.catalog_type = gdb_lookup_type(
                 "mongo::(anonymous namespace)::LatestCollectionCatalog")
 
         def __call__(self, decoration: gdb.Value, /) -> gdb.Value:
@@ -130,18 +148,19 @@ class _CollectionCatalogPrinter(ServiceContextDecorationMixin, ResourceCatalogGe
         short_name = "CollectionCatalog"
 
         def __init__(self) -> None:
-            self.catalog_type = gdb.lookup_type("mongo::CollectionCatalog")
+            self.catalog_type = gdb_lookup_type("mongo::CollectionCatalog")
 
         def __call__(self, decoration: gdb.Value, /) -> gdb.Value:
             return decoration
 
     @classmethod
-    def from_service_context(cls, service_context: gdb.Value, /) -> "_CollectionCatalogPrinter":
-        """Return a _CollectionCatalogPrinter from its decoration on ServiceContext."""
-        catalog_getter: CollectionCatalogGetter
-
+    @functools.lru_cache(maxsize=1)
+    def catalog_getter(cls) -> CollectionCatalogGetter:
+        """Return how the CollectionCatalog is obtained from its decoration on ServiceContext for
+        the version of the MongoDB Server being debugged.
+        """
         try:
-            catalog_getter = cls._LatestCollectionCatalogDecoration()
+            return cls._LatestCollectionCatalogDecoration()
         except gdb.error as err:
             if not err.args[0].startswith("No type named "):
                 raise
@@ -149,8 +168,21 @@ class _CollectionCatalogPrinter(ServiceContextDecorationMixin, ResourceCatalogGe
             # The sole CollectionCatalog instance was previously a direct decoration on the global
             # ServiceContext before becoming a versioned object in SERVER-52556.
             # https://github.com/mongodb/mongo/blob/r4.4.13/src/mongo/db/catalog/collection_catalog.cpp#L47-L48
-            catalog_getter = cls._CollectionCatalogDecoration()
+            return cls._CollectionCatalogDecoration()
 
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Discard the printers constructed by from_service_context()."""
+        cls._cached_printers.clear()
+
+    @classmethod
+    def from_service_context(cls, service_context: gdb.Value, /) -> "_CollectionCatalogPrinter":
+        """Return a _CollectionCatalogPrinter from its decoration on ServiceContext."""
+        service_context_address = _address_of(service_context)
+        if (printer := cls._cached_printers.get(service_context_address)) is not None:
+            return printer
+
+        catalog_getter = cls.catalog_getter()
         for decoration in DecorationIterator(service_context):
             if decoration.type == catalog_getter.catalog_type:
                 catalog = catalog_getter(decoration)
@@ -159,12 +191,18 @@ class _CollectionCatalogPrinter(ServiceContextDecorationMixin, ResourceCatalogGe
             raise ValueError(
                 f"Failed to locate {catalog_getter.short_name} decoration in ServiceContext")
 
-        return cls(catalog)
+        printer = cls._cached_printers[service_context_address] = cls(catalog)
+        return printer
 
 
 # pylint: disable-next=too-few-public-methods
 class ResourceIdFactoryGetter(typing.Protocol):
 
+    _cached_label_arrays: typing.ClassVar[typing.Dict[int, typing.Tuple[gdb.Value, int]]] = {}
+    """Mapping from the address of a std::vector<std::string> of resource labels to a pointer to its
+    first element and its number of elements.
+    """
+
     @abc.abstractmethod
     def lookup_resource_mutex_label(self, res_id: gdb.Value, /) -> str:
         """Return the name of the mutex."""
@@ -174,10 +212,29 @@ class ResourceIdFactoryGetter(typing.Protocol):
     def _lookup_resource_mutex_label_from(cls, res_id: gdb.Value, /, *,
                                           all_labels: gdb.Value) -> str:
         """Return the name of the mutex from the specified vector of resource labels."""
-        xmethod_worker = stdlib_xmethods.VectorMethodsMatcher().match(all_labels.type, "at")
-        label = StdStringPrinter(xmethod_worker(all_labels, res_id)).string()
+        all_labels_address = int(gdb_address_of(all_labels))
+        if (cached := cls._cached_label_arrays.get(all_labels_address)) is None:
+            # Indexing into the std::vector's underlying array directly avoids constructing a
+            # std::vector::at() xmethod worker for every ResourceId printed.
+            start = all_labels["_M_impl"]["_M_start"]
+            num_labels = int(all_labels["_M_impl"]["_M_finish"] - start)
+            cached = cls._cached_label_arrays[all_labels_address] = (start, num_labels)
+
+        (labels, num_labels) = cached
+
+        # The bounds check std::vector::at() would have done is kept so a corrupt ResourceId doesn't
+        # lead to reading arbitrary memory as a std::string.
+        if not 0 <= (index := int(res_id)) < num_labels:
+            raise IndexError(f"Resource label {index} is out of range for {num_labels} labels")
+
+        label = StdStringPrinter(labels[index]).string()
         return label
 
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Discard the resource label arrays found by lookup_resource_mutex_label()."""
+        cls._cached_label_arrays.clear()
+
 
 # We don't have to_string() or children() defined on _ResourceCatalogPrinter right now. Until we
 # have a sense of how else we might want to use the ResourceCatalog in GDB pretty printers, it is
@@ -222,7 +279,7 @@ class _ResourceCatalogPrinter(ServiceContextDecorationMixin, ResourceCatalogGett
             # ServiceContext type as part of SERVER-67383 in MongoDB 6.2. Previously in MongoDB 6.0,
             # the mapping of ResourceIds to collection and database names was managed through the
             # CollectionCatalog.
-            resource_catalog_type = gdb.lookup_type("mongo::ResourceCatalog")
+            resource_catalog_type = gdb_lookup_type("mongo::ResourceCatalog")
         except gdb.error as err:
             if not err.args[0].startswith("No type named "):
                 raise
@@ -275,7 +332,7 @@ class _DatabaseShardingStateMapPrinter(ServiceContextDecorationMixin):
             # The DatabaseShardingStateMap type was introduced and added as a decoration on the
             # ServiceContext type as part of SERVER-34431 in MongoDB 4.4. Previously in MongoDB 4.2,
             # DatabaseShardingState was a decoration on each Database instance.
-            databases_type = gdb.lookup_type(
+            databases_type = gdb_lookup_type(
                 "mongo::(anonymous namespace)::DatabaseShardingStateMap")
         except gdb.error as err:
             if not err.args[0].startswith("No type named "):
@@ -294,6 +351,9 @@ class LockManagerPrinter(PrettyPrinterProtocol, SupportsDisplayHint, ServiceCont
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::LockManager."""
 
+    _cached_decoration_addresses: typing.ClassVar[typing.Dict[int, int]] = {}
+    """Mapping from the mongo::ServiceContext address to the address of its LockManager."""
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.buckets = val["_lockBuckets"]
         self.val = val
@@ -305,6 +365,11 @@ class LockManagerPrinter(PrettyPrinterProtocol, SupportsDisplayHint, ServiceCont
         assert num_buckets is not None
         self.num_buckets = int(num_buckets)
 
+        # The lock buckets are walked lazily and at most once. The children yielded so far are
+        # remembered so to_string() and children() can share the same walk.
+        self._walked_children: typing.List[typing.Tuple[str, gdb.Value]] = []
+        self._walk = self._walk_lock_buckets()
+
     @staticmethod
     def display_hint() -> typing.Literal["map"]:
         return "map"
@@ -315,38 +380,62 @@ class LockManagerPrinter(PrettyPrinterProtocol, SupportsDisplayHint, ServiceCont
         # calling `python print(lock_mgr.val)` would be confusing to users so we implement
         # LockManagerPrinter.to_string() to make this situation more obvious. Unfortunately, the
         # LockManager has no higher-level notion of whether a MODE_S or MODE_X lock request is
-        # present in the system so we may do the work of walking the lock buckets twice.
+        # present in the system so we walk the lock buckets until the first child is found. The
+        # children() method then resumes the walk from there rather than starting over.
         for _ in self.children():
             return "mongo::LockManager dump"
 
         return "mongo::LockManager dump (no strong locks held or pending)"
 
     def children(self) -> typing.Iterator[typing.Tuple[str, gdb.Value]]:
+        yield from self._walked_children
+
+        for child in self._walk:
+            self._walked_children.append(child)
+            yield child
+
+    def _walk_lock_buckets(self) -> typing.Iterator[typing.Tuple[str, gdb.Value]]:
         for i in range(self.num_buckets):
             bucket_data = AbslNodeHashMapPrinter(self.buckets[i]["data"])
+            # Most lock buckets are empty, in which case scanning their control bytes for in-use
+            # slots would find nothing anyway.
+            if bucket_data.settings.size == 0:
+                continue
+
             for (res_id, lock_head_ptr) in bucket_data.items():
                 lock_head = lock_head_ptr.dereference()
                 # We skip displaying anything for resources which have no locks granted on them to
                 # match the behavior of mongo::LockManager::dump(). Resources which aren't held by
                 # anything thread cannot be involved in a deadlock because there could be any
                 # conflicts either.
-                if LockRequestListPrinter(lock_head["grantedList"]):
+                if int(lock_head["grantedList"]["_front"]) != 0:
                     yield ("", res_id)
                     yield ("", lock_head)
 
     @classmethod
     def from_service_context(cls, service_context: gdb.Value, /) -> "LockManagerPrinter":
         """Return a LockManagerPrinter from its decoration on ServiceContext."""
-        lock_manager_type = gdb.lookup_type("mongo::LockManager")
+        lock_manager_type = gdb_lookup_type("mongo::LockManager")
+        service_context_address = _address_of(service_context)
 
-        for decoration in DecorationIterator(service_context):
-            if decoration.type == lock_manager_type:
-                lock_manager = decoration
-                break
-        else:
-            raise ValueError("Failed to locate LockManager decoration in ServiceContext")
+        if (address := cls._cached_decoration_addresses.get(service_context_address)) is None:
+            for decoration in DecorationIterator(service_context):
+                if decoration.type == lock_manager_type:
+                    address = int(gdb_address_of(decoration))
+                    break
+            else:
+                raise ValueError("Failed to locate LockManager decoration in ServiceContext")
 
-        return cls(lock_manager)
+            cls._cached_decoration_addresses[service_context_address] = address
+
+        # Only the location of the decoration is cached so the LockManager itself is always read
+        # fresh from the inferior's memory.
+        return cls(gdb.Value(address).cast(lock_manager_type.pointer()).dereference())
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Discard the decoration locations found by from_service_context()."""
+        cls._cached_decoration_addresses.clear()
 
     @classmethod
     def from_global(cls) -> "LockManagerPrinter":
@@ -367,6 +456,7 @@ class LockRequestListPrinter(PrettyPrinterProtocol, SupportsDisplayHint):
 
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
+        self.front = val["_front"]
 
     @staticmethod
     def display_hint() -> typing.Literal["array"]:
@@ -376,29 +466,41 @@ class LockRequestListPrinter(PrettyPrinterProtocol, SupportsDisplayHint):
         return "mongo::LockRequestList" if self else "Empty mongo::LockRequestList"
 
     def children(self) -> typing.Iterator[typing.Tuple[str, gdb.Value]]:
-        lock_request = self.val["_front"]
+        lock_request = self.front
         while lock_request != 0:
             yield ("", lock_request.dereference())
             lock_request = lock_request["next"]
 
     def __bool__(self) -> bool:
         """Return True if the linked list isn't empty, and return False otherwise."""
-        return self.val["_front"] != 0
+        return self.front != 0
 
 
-# pylint: disable-next=invalid-name
-def ServiceContextClientsListIterator(service_context: gdb.Value, /) -> typing.Iterator[gdb.Value]:
-    """Return a generator of every mongo::Client* in the given mongo::ServiceContext."""
+@functools.lru_cache(maxsize=1)
+def _is_client_map_type_defined() -> bool:
+    """Return True if the mongo::ServiceContext::ClientMap type is defined, and return False
+    otherwise.
+
+    The result is cached so older versions only pay for the gdb.error once.
+    """
     try:
-        gdb.lookup_type("mongo::ServiceContext::ClientMap")
+        gdb_lookup_type("mongo::ServiceContext::ClientMap")
+        return True
     except gdb.error as err:
         if not err.args[0].startswith("No type named "):
             raise
 
-        for (_, client) in AbslNodeHashSetPrinter(service_context["_clients"]).children():
+        return False
+
+
+# pylint: disable-next=invalid-name
+def ServiceContextClientsListIterator(service_context: gdb.Value, /) -> typing.Iterator[gdb.Value]:
+    """Return a generator of every mongo::Client* in the given mongo::ServiceContext."""
+    if _is_client_map_type_defined():
+        for (client, _) in AbslNodeHashMapPrinter(service_context["_clients"]).items():
             yield client
     else:
-        for (client, _) in AbslNodeHashMapPrinter(service_context["_clients"]).items():
+        for (_, client) in AbslNodeHashSetPrinter(service_context["_clients"]).children():
             yield client
 
 
@@ -441,13 +543,13 @@ class LockRequestPrinter(SupportsChildren):
 
             # We augment the field name displayed for the mongo::LockRequest::locker member to
             # include its type. GDB would otherwise only display the mongo::Locker* address.
-            yield (f"locker = ({locker.dynamic_type.pointer()}) {hex(int(locker.address))}",
+            yield (f"locker = ({locker.dynamic_type.pointer()}) {hex(int(gdb_address_of(locker)))}",
                    data_member)
 
             try:
                 # The mongo::LockerImpl type was consolidated with its mongo::Locker base class as
                 # part of SERVER-84753 in MongoDB 7.3.
-                locker_impl_type = gdb.lookup_type("mongo::LockerImpl")
+                locker_impl_type = gdb_lookup_type("mongo::LockerImpl")
             except gdb.error as err:
                 if not err.args[0].startswith("No type named "):
                     raise
@@ -483,7 +585,7 @@ class LockRequestPrinter(SupportsChildren):
             assert self._cached_operation_contexts is not None
 
             if (operation_context :=
-                    self._cached_operation_contexts.get(int(locker.address))) is not None:
+                    self._cached_operation_contexts.get(int(gdb_address_of(locker)))) is not None:
                 # We augment the field name displayed for the mongo::LockRequest::$_opCtx
                 # pseudo-member to include its type. GDB would otherwise only display the
                 # mongo::OperationContext* address. The '$' character included in the field name was
@@ -550,7 +652,7 @@ class LockRequestPrinter(SupportsChildren):
                 # toolchain. We pass in `obj.address` to UniquePtrGetWorker to cancel out the
                 # obj.dereference() call.
                 xmethod_worker = stdlib_xmethods.UniquePtrMethodsMatcher().match(locker.type, "get")
-                if (locker_address := xmethod_worker(locker.address)) != 0:
+                if (locker_address := xmethod_worker(gdb_address_of(locker))) != 0:
                     cached_operation_contexts[int(locker_address)] = operation_context
 
         cls._cached_operation_contexts = cached_operation_contexts
@@ -595,20 +697,91 @@ class ResourceIdPrinter(SupportsToString):
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::ResourceId."""
 
+    _sentinels_resolved: typing.ClassVar[bool] = False
+    """Whether the mongo::ResourceType enumerators below have been looked up yet. Each is None when
+    the enumerator doesn't exist in the version of the MongoDB Server being debugged.
+    """
+
+    _RES_MUTEX: typing.ClassVar[typing.Optional[int]] = None
+    _RES_DATABASE: typing.ClassVar[typing.Optional[int]] = None
+    _RES_COLLECTION: typing.ClassVar[typing.Optional[int]] = None
+    _RES_DDL_DATABASE: typing.ClassVar[typing.Optional[int]] = None
+    _RES_DDL_COLLECTION: typing.ClassVar[typing.Optional[int]] = None
+    _RES_GLOBAL: typing.ClassVar[typing.Optional[int]] = None
+
+    _resource_type_shift: typing.ClassVar[int] = 0
+    """Number of bits the _fullHash is shifted right by to obtain the mongo::ResourceType."""
+
+    _hash_id_mask: typing.ClassVar[int] = 0
+    """Mask applied to the _fullHash to obtain the hash identifying the resource."""
+
+    _resource_type_t: typing.ClassVar[typing.Optional[gdb.Type]] = None
+
+    _resource_catalog_unavailable: typing.ClassVar[bool] = False
+    """Whether the ResourceCatalog was already found not to exist. It only exists starting in
+    MongoDB 6.2 and so the CollectionCatalog is consulted directly in that case.
+    """
+
     def __init__(self, val: gdb.Value, /) -> None:
+        self._resolve_sentinels()
+        assert self._resource_type_t is not None
+
         self.val = val
         self.full_hash = int(val["_fullHash"])
+        self.resource_type = gdb.Value(self.full_hash >> self._resource_type_shift).cast(
+            self._resource_type_t)
+        self.hash_id = self.full_hash & self._hash_id_mask
 
-        resource_type_bits = gdb_lookup_value("mongo::ResourceId::resourceTypeBits")
+    @classmethod
+    def _resolve_sentinels(cls) -> None:
+        if cls._sentinels_resolved:
+            return
+
+        def lookup_int(symbol_name: str, /) -> typing.Optional[int]:
+            return int(value) if (value := gdb_lookup_value(symbol_name)) is not None else None
+
+        cls._RES_MUTEX = lookup_int("mongo::RESOURCE_MUTEX")
+        cls._RES_DATABASE = lookup_int("mongo::RESOURCE_DATABASE")
+        cls._RES_COLLECTION = lookup_int("mongo::RESOURCE_COLLECTION")
+        cls._RES_DDL_DATABASE = lookup_int("mongo::RESOURCE_DDL_DATABASE")
+        cls._RES_DDL_COLLECTION = lookup_int("mongo::RESOURCE_DDL_COLLECTION")
+        cls._RES_GLOBAL = lookup_int("mongo::RESOURCE_GLOBAL")
+
+        resource_type_bits = lookup_int("mongo::ResourceId::resourceTypeBits")
         assert resource_type_bits is not None
-        self.resource_type = gdb.Value(self.full_hash >> (64 - int(resource_type_bits))).cast(
-            gdb.lookup_type("mongo::ResourceType"))
-        self.hash_id = self.full_hash & ((2**64 - 1) >> int(resource_type_bits))
+        cls._resource_type_shift = 64 - resource_type_bits
+        cls._hash_id_mask = (2**64 - 1) >> resource_type_bits
+        cls._resource_type_t = gdb_lookup_type("mongo::ResourceType")
+
+        cls._sentinels_resolved = True
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Discard the mongo::ResourceType enumerators, the mongo::ResourceId layout, and whether
+        the ResourceCatalog exists so they are looked up again.
+        """
+        cls._sentinels_resolved = False
+        cls._resource_catalog_unavailable = False
+
+    @classmethod
+    def _namespace_catalog(cls) -> ResourceCatalogGetter:
+        if not cls._resource_catalog_unavailable:
+            try:
+                return _ResourceCatalogPrinter.from_global()
+            except ValueError:
+                # Only the ResourceCatalog type being missing is remembered. Failing to locate the
+                # decoration on the ServiceContext says nothing about the MongoDB version and so the
+                # ResourceCatalog is looked for again next time.
+                if not gdb_is_type_defined("mongo::ResourceCatalog"):
+                    cls._resource_catalog_unavailable = True
+
+        return _CollectionCatalogPrinter.from_global_service_context()
 
     def to_string(self) -> str:
         ret = f"{{{self.full_hash}: {self.resource_type}, {self.hash_id}}}"
+        resource_type = int(self.resource_type)
 
-        if self.resource_type == gdb_lookup_value("mongo::RESOURCE_MUTEX"):
+        if resource_type == self._RES_MUTEX:
             res_id_factory: ResourceIdFactoryGetter
 
             try:
@@ -634,8 +807,7 @@ class ResourceIdPrinter(SupportsToString):
                     if (db_name := dss_map.lookup_database_name(self.val)) is not None:
                         ret += f", {db_name}"
 
-        if self.resource_type in (gdb_lookup_value("mongo::RESOURCE_DDL_DATABASE"),
-                                  gdb_lookup_value("mongo::RESOURCE_DDL_COLLECTION")):
+        if resource_type in (self._RES_DDL_DATABASE, self._RES_DDL_COLLECTION):
             # Names for the ScopedDatabaseDDLLock and ScopedCollectionDDLLock resources were added
             # to the ResourceCatalog as part of SERVER-77512.
             # https://github.com/mongodb/mongo/blob/r7.1.0/src/mongo/db/concurrency/resource_catalog.cpp#L66-L69
@@ -644,21 +816,12 @@ class ResourceIdPrinter(SupportsToString):
             if (resource_name := resource_catalog.lookup_resource_name(self.val)) is not None:
                 ret += f", {resource_name}"
 
-        if self.resource_type in (gdb_lookup_value("mongo::RESOURCE_DATABASE"),
-                                  gdb_lookup_value("mongo::RESOURCE_COLLECTION")):
-            catalog: ResourceCatalogGetter
-
-            try:
-                catalog = _ResourceCatalogPrinter.from_global()
-            except ValueError:
-                catalog = _CollectionCatalogPrinter.from_global_service_context()
-
-            if (nss := catalog.lookup_resource_name(self.val)) is not None:
+        if resource_type in (self._RES_DATABASE, self._RES_COLLECTION):
+            if (nss := self._namespace_catalog().lookup_resource_name(self.val)) is not None:
                 ret += f", {nss}"
 
-        if (self.resource_type == gdb_lookup_value("mongo::RESOURCE_GLOBAL")
-                and ResourceGlobalIdPrinter.is_type_defined()):
-            global_res_id = gdb.Value(self.hash_id).cast(gdb.lookup_type("mongo::ResourceGlobalId"))
+        if resource_type == self._RES_GLOBAL and ResourceGlobalIdPrinter.is_type_defined():
+            global_res_id = gdb.Value(self.hash_id).cast(gdb_lookup_type("mongo::ResourceGlobalId"))
             ret += f", {global_res_id}"
 
         return ret
@@ -669,8 +832,9 @@ class ResourceTypePrinter(SupportsToString):
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::ResourceType."""
 
-    @property
-    def resource_type_names(self) -> typing.Tuple[str, ...]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def resource_type_names() -> typing.Tuple[str, ...]:
         # We duplicate the contents of mongo::ResourceTypeNames[] here for a couple reasons:
         #
         #   1. gdb.lookup_symbol("mongo::ResourceTypeNames") would OOM the GDB process when
@@ -692,19 +856,26 @@ class ResourceTypePrinter(SupportsToString):
         return (("Invalid", ) + global_resource_names + tenant_resource_name +
                 ("Database", "Collection", "Metadata") + ddl_resource_names + ("Mutex", ))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def resource_type_name_by_value() -> typing.Dict[int, str]:
+        """Return a mapping from each mongo::ResourceType enumerator's value to its name."""
+        return dict(enumerate(ResourceTypePrinter.resource_type_names()))
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
 
     def to_string(self) -> str:
-        return self.resource_type_names[int(self.val)]
+        return type(self).resource_type_name_by_value()[int(self.val)]
 
 
 class ResourceGlobalIdPrinter(SupportsToString):
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::ResourceGlobalId."""
 
-    @property
-    def resource_global_id_names(self) -> typing.Tuple[str, ...]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def resource_global_id_names() -> typing.Tuple[str, ...]:
         # We duplicate the contents of mongo::ResourceGlobalIdNames[] for the same reasons described
         # above in ResourceTypePrinter.
 
@@ -725,25 +896,32 @@ class ResourceGlobalIdPrinter(SupportsToString):
         self.val = val
 
     def to_string(self) -> str:
-        return self.resource_global_id_names[int(self.val)]
+        return type(self).resource_global_id_names()[int(self.val)]
 
     @staticmethod
     def is_type_defined() -> bool:
         """Return True if the ResourceGlobalId type is defined, and return False otherwise."""
-        try:
-            # The ResourceGlobalId type was introduced as part of SERVER-65821 in MongoDB 6.0 and
-            # then subsequently backported to 4.4.15 and 5.0.10. resourceIdParallelBatchWriterMode
-            # and resourceIdReplicationStateTransitionLock, along with a new
-            # resourceIdFeatureCompatibilityVersion, all became distinct resources under the
-            # RESOURCE_GLOBAL ResourceType. The top-level RESOURCE_PBWM and RESOURCE_RSTL
-            # ResourceTypes were removed.
-            gdb.lookup_type("mongo::ResourceGlobalId")
-            return True
-        except gdb.error as err:
-            if not err.args[0].startswith("No type named "):
-                raise
-
-            return False
+        # The ResourceGlobalId type was introduced as part of SERVER-65821 in MongoDB 6.0 and then
+        # subsequently backported to 4.4.15 and 5.0.10. resourceIdParallelBatchWriterMode and
+        # resourceIdReplicationStateTransitionLock, along with a new
+        # resourceIdFeatureCompatibilityVersion, all became distinct resources under the
+        # RESOURCE_GLOBAL ResourceType. The top-level RESOURCE_PBWM and RESOURCE_RSTL ResourceTypes
+        # were removed.
+        return gdb_is_type_defined("mongo::ResourceGlobalId")
+
+
+gdb_invalidate_on_objfile_change(_CollectionCatalogPrinter.cache_clear)
+gdb_invalidate_on_resume(_CollectionCatalogPrinter.cache_clear)
+gdb_invalidate_on_objfile_change(_CollectionCatalogPrinter.catalog_getter.cache_clear)
+gdb_invalidate_on_objfile_change(LockManagerPrinter.cache_clear)
+gdb_invalidate_on_resume(LockManagerPrinter.cache_clear)
+gdb_invalidate_on_objfile_change(ResourceIdFactoryGetter.cache_clear)
+gdb_invalidate_on_resume(ResourceIdFactoryGetter.cache_clear)
+gdb_invalidate_on_objfile_change(ResourceIdPrinter.cache_clear)
+gdb_invalidate_on_objfile_change(ResourceTypePrinter.resource_type_names.cache_clear)
+gdb_invalidate_on_objfile_change(ResourceTypePrinter.resource_type_name_by_value.cache_clear)
+gdb_invalidate_on_objfile_change(ResourceGlobalIdPrinter.resource_global_id_names.cache_clear)
+gdb_invalidate_on_objfile_change(_is_client_map_type_defined.cache_clear)
 
 
 def add_printers(pretty_printer: gdb.printing.RegexpCollectionPrettyPrinter, /) -> None:
@@ -21,6 +21,7 @@ import typing
 
 import gdb
 
+from gdbmongo.gdbutil import gdb_lookup_type
 from gdbmongo.printer_protocol import SupportsToString
 
 
@@ -49,14 +50,43 @@ class MongoOID(ctypes.Structure):
         """Read a 12-byte ObjectId starting from the beginning of the given buffer."""
         return cls.from_buffer(buffer)
 
+    @classmethod
+    def unpack_many(cls, buffer: memoryview, count: int, /) -> typing.List["MongoOID"]:
+        """Read an array of 12-byte ObjectIds starting from the beginning of the given buffer.
+
+        The whole array should be read from the inferior with a single call to
+        gdb.Inferior.read_memory() rather than one call per ObjectId:
+
+        .. code-block:: python
+
+            buffer = gdb.selected_inferior().read_memory(oids.address, count * 12)
+            object_ids = MongoOID.unpack_many(buffer, count)
+        """
+        size = ctypes.sizeof(cls)
+        return [cls.from_buffer(buffer, i * size) for i in range(count)]
+
     def to_value(self) -> gdb.Value:
         """Convert the structure to a gdb.Value of type mongo::OID."""
-        typ = gdb.lookup_type("mongo::OID")
+        typ = gdb_lookup_type("mongo::OID")
         return gdb.Value(memoryview(self), typ)
 
+    @staticmethod
+    def value_from(buffer: memoryview, /) -> gdb.Value:
+        """Read a 12-byte ObjectId starting from the beginning of the given buffer as a gdb.Value of
+        type mongo::OID.
+
+        This is equivalent to ``MongoOID.unpack_from(buffer).to_value()`` but skips constructing the
+        intermediate ctypes structure.
+        """
+        typ = gdb_lookup_type("mongo::OID")
+        return gdb.Value(buffer[:12], typ)
+
 
 setattr(MongoOID, "_fields_", [(field.name, field.type) for field in dataclasses.fields(MongoOID)])
 
+_VALUE_HAS_BYTES = hasattr(gdb.Value, "bytes")
+"""Whether the gdb.Value.bytes attribute is available. It was added in GDB 14."""
+
 
 # pylint: disable-next=too-few-public-methods
 class ObjectIdPrinter(SupportsToString):
@@ -66,10 +96,21 @@ class ObjectIdPrinter(SupportsToString):
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
         self.data = val["_data"]
+        address = self.data.address
+        self.address = int(address) if address is not None else None
 
     def to_string(self) -> str:
-        unsigned_char = gdb.lookup_type("unsigned char")
-        data = bytearray(int(self.data[i].cast(unsigned_char)) for i in range(12))
+        if _VALUE_HAS_BYTES:
+            # gdb.Value.bytes also covers the mongo::OID values which don't live in the inferior's
+            # memory.
+            data = self.data.bytes
+        elif self.address is not None:
+            # Reading all 12 bytes at once avoids casting and converting each byte individually.
+            data = bytes(gdb.selected_inferior().read_memory(self.address, 12))
+        else:
+            unsigned_char = gdb_lookup_type("unsigned char")
+            data = bytes(int(self.data[i].cast(unsigned_char)) for i in range(12))
+
         return f'ObjectId("{data.hex()}")'
 
 
@@ -15,10 +15,12 @@
 ###
 """Pretty-printer for the mongo::StaticImmortal<T> type."""
 
+import typing
+
 import gdb
 
 from gdbmongo.boost_printers import SingletonPrinterBase
-from gdbmongo.gdbutil import gdb_resolve_type
+from gdbmongo.gdbutil import gdb_invalidate_on_objfile_change, gdb_resolve_type
 from gdbmongo.printer_protocol import PrettyPrinterProtocol
 
 
@@ -26,21 +28,43 @@ class StaticImmortalPrinter(PrettyPrinterProtocol, SingletonPrinterBase):
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::StaticImmortal<T>."""
 
+    _cached_pointer_types: typing.ClassVar[typing.Dict[str, gdb.Type]] = {}
+    """Mapping from the name of each already resolved T to the T* type."""
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.element_type = val.type.template_argument(0)
         self.val = val
 
-        gdb_resolve_type(self.element_type)
+        element_typename = str(self.element_type)
+        if (pointer_type := self._cached_pointer_types.get(element_typename)) is None:
+            gdb_resolve_type(self.element_type)
+            pointer_type = self._cached_pointer_types[element_typename] = (
+                self.element_type.pointer())
+
+        self.pointer_type = pointer_type
+        self._contained_value: typing.Optional[gdb.Value] = None
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Discard the resolved element types so they are resolved again."""
+        cls._cached_pointer_types.clear()
 
     def to_string(self) -> str:
         return f"mongo::StaticImmortal<{self.element_type}>"
 
     def value(self) -> gdb.Value:
-        storage = self.val["_storage"]["__data"]
-        contained_value = storage.cast(self.element_type.pointer()).dereference()
+        # The contained value lives in static storage and so its location never changes. The
+        # gdb.Value is lazy and therefore still reads the inferior's memory only when accessed.
+        if (contained_value := self._contained_value) is None:
+            storage = self.val["_storage"]["__data"]
+            contained_value = self._contained_value = storage.cast(self.pointer_type).dereference()
+
         return contained_value
 
 
+gdb_invalidate_on_objfile_change(StaticImmortalPrinter.cache_clear)
+
+
 def add_printers(pretty_printer: gdb.printing.RegexpCollectionPrettyPrinter, /) -> None:
     """Add the StaticImmortalPrinter to the pretty printer collection given."""
     pretty_printer.add_printer("mongo::StaticImmortal", "^mongo::StaticImmortal<.*>$",
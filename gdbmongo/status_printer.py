@@ -19,7 +19,7 @@ import typing
 
 import gdb
 
-from gdbmongo import stdlib_xmethods
+from gdbmongo.gdbutil import gdb_address_of, gdb_invalidate_on_objfile_change
 from gdbmongo.printer_protocol import SupportsChildren, SupportsToString
 
 
@@ -46,7 +46,7 @@ class ErrorExtraInfoPrinter(SupportsToString):
         # Returning a string from to_string() is what suppresses the vtbl-related information.
         # Displaying the address of the ErrorExtraInfo is somewhat arbitrary but at least keeps the
         # GDB output more compact.
-        return hex(int(self.val.address))
+        return f"{int(gdb_address_of(self.val)):#x}"
 
 
 # pylint: disable-next=too-few-public-methods
@@ -59,15 +59,17 @@ class ErrorInfoPrinter(SupportsChildren):
         self.code = val["code"]
         self.reason = val["reason"]
         self.extra = val["extra"]
+        # Reading the std::shared_ptr's stored pointer directly avoids having to construct a get()
+        # xmethod worker for it.
+        self.extra_ptr = self.extra["_M_ptr"]
 
     def children(self) -> typing.Iterator[typing.Tuple[str, gdb.Value]]:
         yield ("code", self.code)
         yield ("reason", self.reason)
 
-        xmethod_worker = stdlib_xmethods.SharedPtrMethodsMatcher().match(self.extra.type, "get")
-
-        if (extra_info_ptr := xmethod_worker(self.extra)) != 0:
-            extra_info = extra_info_ptr.dereference()
+        # Most errors don't carry any ErrorExtraInfo.
+        if self.extra_ptr != 0:
+            extra_info = self.extra_ptr.dereference()
             # The ErrorExtraInfo object must be cast to the derived type for GDB to actually display
             # its members from the derived type.
             yield ("extra", extra_info.cast(extra_info.dynamic_type))
@@ -78,16 +80,31 @@ class StatusPrinter(SupportsToString):
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::Status."""
 
+    _error_is_intrusive_ptr: typing.ClassVar[typing.Optional[bool]] = None
+    """Whether the `Status::_error` member is a boost::intrusive_ptr<ErrorInfo> rather than an
+    ErrorInfo*. It is a property of the mongo::Status type and so is only checked once.
+    """
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
+        self.error = self.resolve_error(val)
 
-        error = val["_error"]
-        if error.type.code != gdb.TYPE_CODE_PTR:
+    @classmethod
+    def resolve_error(cls, status: gdb.Value, /) -> gdb.Value:
+        """Return the ErrorInfo* of the Status given, which is nullptr for Status::OK()."""
+        error = status["_error"]
+        if (error_is_intrusive_ptr := cls._error_is_intrusive_ptr) is None:
             # The type of the `Status::_error` member was changed from ErrorInfo* to
             # boost::intrusive_ptr<ErrorInfo> as part of SERVER-52904 in MongoDB 5.1.
-            error = error["px"]
+            error_is_intrusive_ptr = error.type.code != gdb.TYPE_CODE_PTR
+            cls._error_is_intrusive_ptr = error_is_intrusive_ptr
 
-        self.error = error
+        return error["px"] if error_is_intrusive_ptr else error
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Discard the layout of the mongo::Status type so it is checked again."""
+        cls._error_is_intrusive_ptr = None
 
     def to_string(self) -> typing.Union[str, gdb.Value]:
         if self.error == 0:
@@ -109,13 +126,15 @@ class StatusWithPrinter(SupportsToString):
         self.opt_value = val["_t"]
 
     def to_string(self) -> gdb.Value:
-        status = StatusPrinter(self.status)
-        if status.error != 0:
+        if StatusPrinter.resolve_error(self.status) != 0:
             return self.status
 
         return self.opt_value
 
 
+gdb_invalidate_on_objfile_change(StatusPrinter.cache_clear)
+
+
 def add_printers(pretty_printer: gdb.printing.RegexpCollectionPrettyPrinter, /) -> None:
     """Add the Status-related printers to the pretty printer collection given."""
     pretty_printer.add_printer("mongo::ErrorExtraInfo", "^mongo::ErrorExtraInfo$",
@@ -41,20 +41,46 @@ the following Python snippet:
 """
 
 import importlib
+import sys
 import types
 import typing
 
 import gdbmongo.stdlib_printers_loader
 
+_SUBMODULE_NAME = f"{gdbmongo.stdlib_printers_loader.MODULE_NAME}.printers"
+
+_cached_dir: typing.Dict[types.ModuleType, typing.List[str]] = {}
+"""Mapping from the gdb.libstdcxx.v6.printers submodule to the names listed by dir() for it."""
+
 
 def _resolve_printers_submodule() -> types.ModuleType:
     """Import the gdb.libstdcxx.v6.printers submodule."""
+    # Every attribute access on this proxy module resolves the submodule. Checking sys.modules
+    # directly is cheaper than going through importlib.import_module() each time. The submodule
+    # isn't cached here so it remains possible to unregister it from sys.modules.
+    if (module := sys.modules.get(_SUBMODULE_NAME)) is not None:
+        return module
+
     return importlib.import_module(".printers", package=gdbmongo.stdlib_printers_loader.MODULE_NAME)
 
 
 def __getattr__(name: str) -> typing.Any:
-    return getattr(_resolve_printers_submodule(), name)
+    module = _resolve_printers_submodule()
+
+    try:
+        # Reading the module's namespace directly is cheaper than going through getattr().
+        return module.__dict__[name]
+    except KeyError:
+        return getattr(module, name)
 
 
 def __dir__() -> typing.List[str]:
-    return dir(_resolve_printers_submodule())
+    module = _resolve_printers_submodule()
+
+    # The listing is only reused while the same submodule remains registered. Registering another
+    # toolchain's submodule in its place discards the previous listing.
+    if (names := _cached_dir.get(module)) is None:
+        _cached_dir.clear()
+        names = _cached_dir[module] = dir(module)
+
+    return names
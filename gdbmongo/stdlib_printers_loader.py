@@ -16,6 +16,7 @@
 """Load the module containing the libstdc++ GDB pretty printers."""
 
 import importlib.util
+import pathlib
 import sys
 import types
 import typing
@@ -27,19 +28,17 @@ import gdbmongo.detect_toolchain
 # https://sourceware.org/gdb/onlinedocs/gdb/Writing-a-Pretty_002dPrinter.html.
 MODULE_NAME = "gdb.libstdcxx.v6"
 
+_loaded_modules: typing.Dict[pathlib.Path, types.ModuleType] = {}
+"""Mapping from the libstdc++ python directory to the gdb.libstdcxx.v6 module executed from it."""
 
-def resolve_import(toolchain_info: gdbmongo.detect_toolchain.ToolchainInfo,
-                   /) -> typing.Tuple[types.ModuleType, typing.Callable[[], None]]:
-    """Load the module containing the libstdc++ GDB pretty printers.
 
-    Returns a pair of the gdb.libstdcxx.v6 module and a 0-argument function to register the module
-    in sys.modules so later Python import statements from it can be made. In particular, invoking
-    the 0-argument function will NOT have registered the pretty printers with GDB itself. The caller
-    must take care to call register_libstdcxx_printers() on the returned module object.
-    """
-    if (libstdcxx_python_home := toolchain_info.libstdcxx_python_home) is None:
-        raise ValueError("Unable to import libstdc++ GDB pretty printers")
+def clear_cache() -> None:
+    """Forget the modules previously loaded by resolve_import() so they are executed again."""
+    _loaded_modules.clear()
 
+
+def _exec_module(libstdcxx_python_home: pathlib.Path, /) -> types.ModuleType:
+    """Execute the gdb.libstdcxx.v6 package from the given libstdc++ python directory."""
     module_location = libstdcxx_python_home.joinpath("libstdcxx", "v6", "__init__.py")
     spec = importlib.util.spec_from_file_location(MODULE_NAME, module_location)
     assert spec is not None
@@ -50,6 +49,28 @@ def resolve_import(toolchain_info: gdbmongo.detect_toolchain.ToolchainInfo,
     # doesn't depend on there being an entry in sys.modules when it is executed anyway.
     assert spec.loader is not None
     spec.loader.exec_module(module)
+    return module
+
+
+def resolve_import(toolchain_info: gdbmongo.detect_toolchain.ToolchainInfo,
+                   /) -> typing.Tuple[types.ModuleType, typing.Callable[[], None]]:
+    """Load the module containing the libstdc++ GDB pretty printers.
+
+    Returns a pair of the gdb.libstdcxx.v6 module and a 0-argument function to register the module
+    in sys.modules so later Python import statements from it can be made. In particular, invoking
+    the 0-argument function will NOT have registered the pretty printers with GDB itself. The caller
+    must take care to call register_libstdcxx_printers() on the returned module object.
+    """
+    if (libstdcxx_python_home := toolchain_info.libstdcxx_python_home) is None:
+        raise ValueError("Unable to import libstdc++ GDB pretty printers")
+
+    # Executing the gdb.libstdcxx.v6 package is the most expensive part of registering the pretty
+    # printers. The module is reused when the same toolchain's pretty printers are requested again.
+    libstdcxx_python_home = libstdcxx_python_home.resolve()
+    if libstdcxx_python_home not in _loaded_modules:
+        _loaded_modules[libstdcxx_python_home] = _exec_module(libstdcxx_python_home)
+
+    module = _loaded_modules[libstdcxx_python_home]
 
     def register_module() -> None:
         sys.modules[MODULE_NAME] = module
@@ -42,19 +42,34 @@ the following Python snippet:
 """
 
 import importlib
+import sys
 import types
 import typing
 
 import gdbmongo.stdlib_printers_loader
 
+_SUBMODULE_NAME = f"{gdbmongo.stdlib_printers_loader.MODULE_NAME}.xmethods"
+
 
 def _resolve_xmethods_submodule() -> types.ModuleType:
     """Import the gdb.libstdcxx.v6.xmethods submodule."""
+    # Every attribute access on this proxy module resolves the submodule. Checking sys.modules
+    # directly is cheaper than going through importlib.import_module() each time. The submodule
+    # isn't cached here so it remains possible to unregister it from sys.modules.
+    if (module := sys.modules.get(_SUBMODULE_NAME)) is not None:
+        return module
+
     return importlib.import_module(".xmethods", package=gdbmongo.stdlib_printers_loader.MODULE_NAME)
 
 
 def __getattr__(name: str) -> typing.Any:
-    return getattr(_resolve_xmethods_submodule(), name)
+    module = _resolve_xmethods_submodule()
+
+    try:
+        # Reading the module's namespace directly is cheaper than going through getattr().
+        return module.__dict__[name]
+    except KeyError:
+        return getattr(module, name)
 
 
 def __dir__() -> typing.List[str]:
@@ -17,14 +17,14 @@
 
 import abc
 import ctypes
-import dataclasses
+import functools
 import struct
 import typing
 
 import gdb
 
 from gdbmongo import stdlib_printers
-from gdbmongo.gdbutil import gdb_lookup_value
+from gdbmongo.gdbutil import gdb_invalidate_on_objfile_change, gdb_lookup_type, gdb_lookup_value
 from gdbmongo.printer_protocol import LazyString, SupportsDisplayHint, SupportsToString
 
 
@@ -37,21 +37,52 @@ class ValueAsPythonStringMixin(SupportsToString):
     be the display_hint() method of the subclass returns "string".
     """
 
+    _cached_string: typing.Optional[str] = None
+    """The full string once it has been read from the inferior's memory."""
+
     @abc.abstractmethod
     def to_string(self) -> typing.Union[str, gdb.Value, LazyString, None]:
         raise NotImplementedError
 
-    def string(self) -> str:
-        """Return the value as a Python string."""
+    def string(self, *, max_length: typing.Optional[int] = None) -> str:
+        """Return the value as a Python string.
+
+        When `max_length` is specified, no more than that many characters are read from the
+        inferior's memory for a string whose length is already known, such as one returned by
+        to_string() as a lazy string. This is useful for callers which only need a prefix of a
+        potentially long string. The argument is ignored for null-terminated strings because
+        gdb.Value.string() would otherwise read exactly `max_length` characters past the null byte.
+
+        The full string is remembered by the printer instance after it has been read once.
+        """
+        if max_length is not None:
+            return self._read_string(max_length=max_length)
+
+        if self._cached_string is None:
+            self._cached_string = self._read_string(max_length=None)
+
+        return self._cached_string
+
+    @staticmethod
+    def _clamp_length(length: int, max_length: typing.Optional[int], /) -> int:
+        """Return the number of characters to read of a string with the given known length."""
+        return length if max_length is None else min(length, max_length)
+
+    def _read_string(self, *, max_length: typing.Optional[int]) -> str:
+        """Read the value as a Python string."""
         ret = self.to_string()
         assert ret is not None
 
+        if isinstance(ret, str):
+            return ret
         if isinstance(ret, gdb.Value):
             return ret.string()
-        if isinstance(ret, LazyString):
-            # LazyString.value() can only be called for non-nullptr strings.
-            return ret.value().string(length=ret.length) if ret.address != 0 else ""
-        return ret
+        # LazyString.value() can only be called for non-nullptr strings.
+        if ret.address == 0:
+            return ""
+
+        length = ret.length if ret.length == -1 else self._clamp_length(ret.length, max_length)
+        return ret.value().string(length=length)
 
 
 class StdStringPrinter(SupportsDisplayHint, ValueAsPythonStringMixin):
@@ -65,13 +96,41 @@ class StdStringPrinter(SupportsDisplayHint, ValueAsPythonStringMixin):
     these issues by instead calling gdb.Value.string().
     """
 
+    _cached_typenames: typing.ClassVar[typing.Dict[str, str]] = {}
+    """Mapping from the name of a std::string type as written to the name with typedefs stripped."""
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
+        # The libstdc++ pretty printer is only constructed once it is needed because
+        # StdStringPrinter.string() can usually read the characters without it.
+        self._printer: typing.Optional[stdlib_printers.StdStringPrinter] = None
+
+    @property
+    def printer(self) -> stdlib_printers.StdStringPrinter:
+        """Return the libstdc++ pretty printer for the std::string value."""
+        if self._printer is not None:
+            return self._printer
+
+        if (declared_name := self.val.type.name) is not None:
+            typename = StdStringPrinter._cached_typenames.get(declared_name)
+        else:
+            typename = None
+
+        if typename is None:
+            typ = self.val.type.strip_typedefs()
+            typename = typ.tag if typ.tag is not None else typ.name
+            assert typename is not None
 
-        typ = val.type.strip_typedefs()
-        typename = typ.tag if typ.tag is not None else typ.name
-        assert typename is not None
-        self.printer = stdlib_printers.StdStringPrinter(typename, val)
+            if declared_name is not None:
+                StdStringPrinter._cached_typenames[declared_name] = typename
+
+        self._printer = stdlib_printers.StdStringPrinter(typename, self.val)
+        return self._printer
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Invalidate the cache of resolved std::string type names."""
+        cls._cached_typenames.clear()
 
     @staticmethod
     def display_hint() -> typing.Literal["string"]:
@@ -80,6 +139,23 @@ class StdStringPrinter(SupportsDisplayHint, ValueAsPythonStringMixin):
     def to_string(self) -> typing.Union[str, gdb.Value, LazyString, None]:
         return self.printer.to_string()
 
+    def _read_string(self, *, max_length: typing.Optional[int]) -> str:
+        try:
+            # The std::string class for the C++11 ABI stores a pointer to its characters and its
+            # length directly. Reading them here avoids going through the libstdc++ pretty printer
+            # and fetches the characters with a single read of the inferior's memory.
+            data = self.val["_M_dataplus"]["_M_p"]
+            length = int(self.val["_M_string_length"])
+        except gdb.error:
+            return super()._read_string(max_length=max_length)
+
+        if length == 0:
+            return ""
+
+        # gdb.Value.string() decodes the characters the same way as the libstdc++ pretty printer's
+        # lazy string would have been.
+        return data.string(length=self._clamp_length(length, max_length))
+
 
 # pylint: disable-next=invalid-name
 # pylint: disable-next=too-few-public-methods
@@ -93,7 +169,7 @@ class c_size_t(ctypes.c_size_t):
     """Wrapper class for ctypes.c_size_t to avoid implicit conversion to int."""
 
 
-@dataclasses.dataclass
+# pylint: disable-next=too-few-public-methods
 class MongoStringDataLayoutStdStringView(ctypes.Structure):
     """Structure with a memory layout compatible with that of mongo::StringData.
 
@@ -112,13 +188,10 @@ class MongoStringDataLayoutStdStringView(ctypes.Structure):
     size: c_size_t
     data: c_char_p
 
-
-setattr(MongoStringDataLayoutStdStringView, "_fields_",
-        [(field.name, field.type)
-         for field in dataclasses.fields(MongoStringDataLayoutStdStringView)])
+    _fields_ = [("size", c_size_t), ("data", c_char_p)]
 
 
-@dataclasses.dataclass
+# pylint: disable-next=too-few-public-methods
 class MongoStringDataLayoutPre73(ctypes.Structure):
     """Structure with a memory layout compatible with that of mongo::StringData.
 
@@ -137,9 +210,30 @@ class MongoStringDataLayoutPre73(ctypes.Structure):
     data: c_char_p
     size: c_size_t
 
+    _fields_ = [("data", c_char_p), ("size", c_size_t)]
+
+
+_PASCAL_LEN_STRUCT = struct.Struct("<i")
+"""Format of the 4-byte length prefix of a length-prefixed string."""
 
-setattr(MongoStringDataLayoutPre73, "_fields_",
-        [(field.name, field.type) for field in dataclasses.fields(MongoStringDataLayoutPre73)])
+
+def _find_null_terminator(view: memoryview, maxsize: int, /) -> int:
+    """Return the offset of the first null byte within the first `maxsize` bytes of the buffer, or
+    return `maxsize` if there isn't one.
+
+    The buffer is copied and searched in chunks of doubling size because the string is typically
+    much shorter than the remainder of the buffer it is read from.
+    """
+    (offset, chunk_size) = (0, 64)
+
+    while offset < maxsize:
+        end = min(offset + chunk_size, maxsize)
+        if (index := bytes(view[offset:end]).find(b"\x00")) != -1:
+            return offset + index
+
+        (offset, chunk_size) = (end, chunk_size * 2)
+
+    return maxsize
 
 
 class MongoStringData(ctypes.Union):
@@ -176,8 +270,6 @@ class MongoStringData(ctypes.Union):
     layout_string_view: MongoStringDataLayoutStdStringView
     layout_pre73: MongoStringDataLayoutPre73
 
-    # dataclasses.dataclass doesn't appear to be compatible with ctypes.Union. We enumerate
-    # `MongoStringData._fields_` explicitly instead of relying on the type annotations.
     _fields_ = [("layout_string_view", MongoStringDataLayoutStdStringView),
                 ("layout_pre73", MongoStringDataLayoutPre73)]
 
@@ -193,12 +285,19 @@ class MongoStringData(ctypes.Union):
                 layout_pre73=MongoStringDataLayoutPre73(data=c_char_p(data), size=c_size_t(size)))
 
     @classmethod
-    def from_cstring(cls, val: gdb.Value, /, *, maxsize: int) -> "MongoStringData":
-        """Read a null-terminated string starting from the beginning of the given buffer."""
+    def from_cstring(cls, val: gdb.Value, /, *, maxsize: int,
+                     view: typing.Optional[memoryview] = None) -> "MongoStringData":
+        """Read a null-terminated string starting from the beginning of the given buffer.
+
+        The null terminator is searched for within `view` when the caller has already read the
+        buffer from the inferior's memory. Otherwise the inferior's memory is searched instead.
+        """
         start = int(val)
         size = maxsize
 
-        if (end := gdb.selected_inferior().search_memory(start, maxsize, b"\x00")) is not None:
+        if view is not None:
+            size = _find_null_terminator(view, maxsize)
+        elif (end := gdb.selected_inferior().search_memory(start, maxsize, b"\x00")) is not None:
             size = end - start
 
         return cls(data=start, size=size)
@@ -206,10 +305,23 @@ class MongoStringData(ctypes.Union):
     @classmethod
     def from_pascalstring(cls, val: gdb.Value, /, *, view: memoryview) -> "MongoStringData":
         """Read a length-prefixed string starting from the beginning of the given buffer."""
-        fmt = "<i"
-        (size, ) = struct.unpack_from(fmt, view)
+        (size, ) = _PASCAL_LEN_STRUCT.unpack_from(view)
 
-        return cls(data=int(val + struct.calcsize(fmt)), size=size)
+        return cls(data=int(val) + _PASCAL_LEN_STRUCT.size, size=size)
+
+    @classmethod
+    def iter_pascalstrings(cls, val: gdb.Value, /, *, view: memoryview,
+                           offsets: typing.Iterable[int]) -> typing.Iterator["MongoStringData"]:
+        """Read a length-prefixed string at each of the offsets into the given buffer.
+
+        The buffer is expected to have been read with a single call to gdb.Inferior.read_memory()
+        so the strings don't each need to be read from the inferior separately.
+        """
+        start = int(val)
+
+        for offset in offsets:
+            (size, ) = _PASCAL_LEN_STRUCT.unpack_from(view, offset)
+            yield cls(data=start + offset + _PASCAL_LEN_STRUCT.size, size=size)
 
     @property
     def data(self) -> c_char_p:
@@ -225,33 +337,84 @@ class MongoStringData(ctypes.Union):
 
     def to_value(self) -> gdb.Value:
         """Convert the structure to a gdb.Value of type mongo::StringData."""
-        typ = gdb.lookup_type("mongo::StringData")
-        return gdb.Value(memoryview(self), typ)
+        typ = gdb_lookup_type("mongo::StringData")
+        # The ctypes object supports the buffer protocol itself and so gdb.Value() can copy from it
+        # without a memoryview being created first.
+        return gdb.Value(self, typ)
 
 
 class StringDataPrinter(SupportsDisplayHint, ValueAsPythonStringMixin):
     # pylint: disable=missing-function-docstring
     """Pretty-printer for mongo::StringData."""
 
+    eager_read_max_size: typing.ClassVar[int] = 4096
+    """Maximum length of a string for it to be read in full rather than as a lazy string."""
+
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
+        self.string_view = (val[StringDataPrinter.member_field("_sv")]
+                            if StringDataPrinter.is_wrapping_std_string_view() else None)
 
     @staticmethod
     def display_hint() -> typing.Literal["string"]:
         return "string"
 
-    def to_string(self) -> typing.Union[gdb.Value, LazyString]:
-        if StringDataPrinter.is_wrapping_std_string_view():
-            return self.val["_sv"]
+    def to_string(self) -> typing.Union[str, gdb.Value, LazyString]:
+        if self.string_view is not None:
+            return self.string_view
+
+        data = self.val[StringDataPrinter.member_field("_data")]
+        size = int(self.val[StringDataPrinter.member_field("_size")])
+
+        if size == 0:
+            return ""
+
+        if size <= StringDataPrinter.eager_read_max_size:
+            # Reading a short string with a single gdb.Inferior.read_memory() call avoids GDB
+            # potentially fetching the characters of the lazy string in several smaller reads. The
+            # characters are returned as a char array rather than decoded in Python so GDB still
+            # escapes any bytes which aren't valid in the target character set.
+            buffer = gdb.selected_inferior().read_memory(data, size)
+            return gdb.Value(buffer, gdb_lookup_type("char").array(size - 1))
+
+        return data.lazy_string(length=size)
+
+    def _read_string(self, *, max_length: typing.Optional[int]) -> str:
+        if self.string_view is not None:
+            return super()._read_string(max_length=max_length)
 
-        return self.val["_data"].lazy_string(length=int(self.val["_size"]))
+        size = int(self.val[StringDataPrinter.member_field("_size")])
+        if size == 0:
+            return ""
+
+        # The char array returned by to_string() for short strings would have gdb.Value.string()
+        # stop at the first null byte. The characters are instead read according to their size.
+        data = self.val[StringDataPrinter.member_field("_data")]
+        return data.string(length=self._clamp_length(size, max_length))
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_wrapping_std_string_view() -> bool:
         # The StringData class was changed to be a thin wrapper over std::string_view as part of
         # SERVER-82604 in MongoDB 7.3.
         return gdb_lookup_value("mongo::StringData::npos") is not None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def member_field(name: str, /) -> gdb.Field:
+        # Indexing a gdb.Value by gdb.Field rather than by name skips searching the fields of
+        # mongo::StringData each time a string is printed.
+        for field in gdb_lookup_type("mongo::StringData").fields():
+            if field.name == name:
+                return field
+
+        raise gdb.error(f"There is no member named {name}.")
+
+
+gdb_invalidate_on_objfile_change(StdStringPrinter.cache_clear)
+gdb_invalidate_on_objfile_change(StringDataPrinter.is_wrapping_std_string_view.cache_clear)
+gdb_invalidate_on_objfile_change(StringDataPrinter.member_field.cache_clear)
+
 
 def add_printers(pretty_printer: gdb.printing.RegexpCollectionPrettyPrinter, /) -> None:
     """Add the StringDataPrinter to the pretty printer collection given."""
@@ -15,16 +15,25 @@
 ###
 """Pretty-printer for the mongo::(anonymous namespace)::ThreadNameInfo type."""
 
+import functools
+import itertools
 import typing
 
 import gdb
 
-from gdbmongo import stdlib_printers
 from gdbmongo.decorable_printer import DecorationIterator
+from gdbmongo.gdbutil import (gdb_address_of, gdb_invalidate_on_objfile_change,
+                              gdb_invalidate_on_resume, gdb_is_type_defined, gdb_lookup_type)
 from gdbmongo.printer_protocol import SupportsDisplayHint
 from gdbmongo.string_data_printer import (StdStringPrinter, StringDataPrinter,
                                           ValueAsPythonStringMixin)
 
+_cached_thread_names: typing.Dict[int, str] = {}
+"""Mapping from a thread's global number to the thread's full name."""
+
+gdb_invalidate_on_objfile_change(_cached_thread_names.clear)
+gdb_invalidate_on_resume(_cached_thread_names.clear)
+
 
 def get_thread_name() -> str:
     """Return the full name associated with the selected thread.
@@ -35,54 +44,80 @@ def get_thread_name() -> str:
     Furthermore, core dumps do not record the thread names which were made visible to the kernel.
     mongo::(anonymous namespace)::ThreadNameInfo is therefore the only memory location where the
     thread's name is recorded in a core dump.
+
+    The thread name is remembered until the inferior resumes because reading it involves several
+    symbol lookups and possibly walking the decorations of the ThreadContext object.
     """
-    try:
-        # The ThreadNameInfo type replaced the ThreadNameSconce type for representing the storage
-        # for the thread name as part of SERVER-63852 in MongoDB 6.1 and was then subsequently
-        # backported to 5.0.12 and 6.0.2. In some versions the ThreadNameInfo instance is managed
-        # directly as a thread-local variable, and in other versions it is managed as a decoration
-        # within the ThreadContext object.
-        thread_info_type = gdb.lookup_type("mongo::(anonymous namespace)::ThreadNameInfo")
-    except gdb.error as err:
-        if not err.args[0].startswith("No type named "):
-            raise
+    # There is no thread to remember the name for when the inferior isn't running.
+    if (thread := gdb.selected_thread()) is None:
+        return _read_thread_name()
+
+    if (thread_name := _cached_thread_names.get(thread.global_num)) is None:
+        thread_name = _cached_thread_names[thread.global_num] = _read_thread_name()
+
+    return thread_name
+
 
-        try:
-            # The ThreadNameSconce type was introduced for representing the storage for the thread
-            # name as part of SERVER-52821 in MongoDB 5.0. It is always managed as a decoration
-            # within the ThreadContext object. Previously in MongoDB 4.4, the thread name was made
-            # available through a thread-local StringData variable.
-            thread_sconce_type = gdb.lookup_type("mongo::(anonymous namespace)::ThreadNameSconce")
-        except gdb.error as err2:
-            if not err2.args[0].startswith("No type named "):
-                raise
-
-            thread_name = gdb.parse_and_eval("mongo::for_debuggers::threadName")
-            return StringDataPrinter(thread_name).string()
-        else:
-            return _get_thread_name_from_sconce(thread_sconce_type)
+@functools.lru_cache(maxsize=1)
+def _thread_name_schema() -> typing.Literal["tls", "decoration", "sconce", "string_data"]:
+    """Return how the executable stores the thread name.
+
+    The answer depends only on the symbols of the executable so it is computed once rather than
+    probing for each of the older layouts every time a thread name is read.
+    """
+    # The ThreadNameInfo type replaced the ThreadNameSconce type for representing the storage for
+    # the thread name as part of SERVER-63852 in MongoDB 6.1 and was then subsequently backported to
+    # 5.0.12 and 6.0.2. In some versions the ThreadNameInfo instance is managed directly as a
+    # thread-local variable, and in other versions it is managed as a decoration within the
+    # ThreadContext object.
+    if not gdb_is_type_defined("mongo::(anonymous namespace)::ThreadNameInfo"):
+        # The ThreadNameSconce type was introduced for representing the storage for the thread name
+        # as part of SERVER-52821 in MongoDB 5.0. It is always managed as a decoration within the
+        # ThreadContext object. Previously in MongoDB 4.4, the thread name was made available
+        # through a thread-local StringData variable.
+        if not gdb_is_type_defined("mongo::(anonymous namespace)::ThreadNameSconce"):
+            return "string_data"
+
+        return "sconce"
 
     try:
         # The `tls` thread-local variable was introduced to the ThreadNameInfo::forThisThread()
         # static function as part of SERVER-66385 in MongoDB 6.1. The ThreadNameInfo instance was
         # previously managed as a decoration within the ThreadContext object.
-        thread_info_pp = gdb.parse_and_eval(
-            "&'mongo::(anonymous namespace)::ThreadNameInfo::forThisThread()::tls'")
+        gdb.parse_and_eval("&'mongo::(anonymous namespace)::ThreadNameInfo::forThisThread()::tls'")
     except gdb.error as err:
         if not err.args[0].startswith("No symbol "):
             raise
 
+        return "decoration"
+    else:
+        return "tls"
+
+
+gdb_invalidate_on_objfile_change(_thread_name_schema.cache_clear)
+
+
+def _read_thread_name() -> str:
+    """Return the full name associated with the selected thread without consulting the cache."""
+    if (schema := _thread_name_schema()) == "string_data":
+        thread_name = gdb.parse_and_eval("mongo::for_debuggers::threadName")
+        return StringDataPrinter(thread_name).string()
+
+    if schema == "sconce":
+        return _get_thread_name_from_sconce(
+            gdb_lookup_type("mongo::(anonymous namespace)::ThreadNameSconce"))
+
+    thread_info_type = gdb_lookup_type("mongo::(anonymous namespace)::ThreadNameInfo")
+
+    if schema == "decoration":
         if (thread_context := _get_thread_context()) == 0:
             return ""
 
-        for decoration in DecorationIterator(thread_context.dereference()):
-            if decoration.type == thread_info_type:
-                thread_info = decoration.address
-                break
-        else:
-            raise ValueError(
-                "Failed to locate ThreadNameInfo decoration in ThreadContext") from None
+        thread_info = _find_thread_context_decoration(thread_context, thread_info_type)
     else:
+        thread_info_pp = gdb.parse_and_eval(
+            "&'mongo::(anonymous namespace)::ThreadNameInfo::forThisThread()::tls'")
+
         # The 'mongo::(anonymous namespace)::ThreadNameInfo::forThisThread():Tls' struct has a
         # trivial definition and its typeinfo can be elided.
         #
@@ -106,12 +141,7 @@ def _get_thread_name_from_sconce(thread_sconce_type: gdb.Type, /) -> str:
     if (thread_context := _get_thread_context()) == 0:
         return ""
 
-    for decoration in DecorationIterator(thread_context.dereference()):
-        if decoration.type == thread_sconce_type:
-            thread_sconce = decoration.address
-            break
-    else:
-        raise ValueError("Failed to locate ThreadNameSconce decoration in ThreadContext")
+    thread_sconce = _find_thread_context_decoration(thread_context, thread_sconce_type)
 
     if (thread_name := thread_sconce["activePtr"]["px"]) == 0:
         thread_name = thread_sconce["cachedPtr"]["px"]
@@ -119,12 +149,43 @@ def _get_thread_name_from_sconce(thread_sconce_type: gdb.Type, /) -> str:
     return _ThreadNamePrinter(thread_name.dereference()).string() if thread_name != 0 else ""
 
 
+_cached_decoration_indexes: typing.Dict[str, int] = {}
+"""Mapping from a decoration type name to its position among the ThreadContext decorations."""
+
+gdb_invalidate_on_objfile_change(_cached_decoration_indexes.clear)
+
+
+def _find_thread_context_decoration(thread_context: gdb.Value, decoration_type: gdb.Type,
+                                    /) -> gdb.Value:
+    """Return a pointer to the decoration of the given type within the ThreadContext object.
+
+    The decorations are registered in the same order for every ThreadContext object. The position
+    of the decoration is therefore remembered to avoid comparing the type of each decoration which
+    precedes it. The decoration storage is allocated separately from the ThreadContext object and so
+    its byte offset cannot be remembered instead.
+    """
+    decorations = DecorationIterator(thread_context.dereference())
+    typename = str(decoration_type)
+
+    if (index := _cached_decoration_indexes.get(typename)) is not None:
+        decoration = next(itertools.islice(decorations, index, None))
+        assert decoration.type == decoration_type
+        return gdb_address_of(decoration)
+
+    for (index, decoration) in enumerate(decorations):
+        if decoration.type == decoration_type:
+            _cached_decoration_indexes[typename] = index
+            return gdb_address_of(decoration)
+
+    raise ValueError(f"Failed to locate {decoration_type.name} decoration in ThreadContext")
+
+
 def _get_thread_context() -> gdb.Value:
     """Return the ThreadContext object associated with the current thread."""
-    thread_context_handle_p = gdb.parse_and_eval("&mongo::ThreadContext::_handle")
-    thread_context_handle_type = gdb.lookup_type("mongo::ThreadContext::Handle")
-    thread_context_handle_p = thread_context_handle_p.cast(thread_context_handle_type.pointer())
-    return thread_context_handle_p.dereference()["instance"]["px"]
+    # Casting and dereferencing within the expression evaluated by GDB avoids creating a gdb.Value
+    # for each intermediate step.
+    return gdb.parse_and_eval(
+        "((mongo::ThreadContext::Handle*) &mongo::ThreadContext::_handle)->instance.px")
 
 
 # mongo::(anonymous namespace)::ThreadNameInfo isn't a type which is likely to be printed so we
@@ -141,10 +202,12 @@ class _ThreadNameInfoPrinter(SupportsDisplayHint, ValueAsPythonStringMixin):
         return "string"
 
     def to_string(self) -> str:
-        thread_name = stdlib_printers.SharedPointerPrinter(
-            "std::shared_ptr", self.val["_h"]["_ptr"]).pointer.dereference()
+        # Reading std::shared_ptr<T>::_M_ptr directly avoids constructing a libstdc++ pretty printer
+        # only to dereference the managed pointer.
+        if (thread_name_p := self.val["_h"]["_ptr"]["_M_ptr"]) == 0:
+            return ""
 
-        return StdStringPrinter(thread_name).string()
+        return StdStringPrinter(thread_name_p.dereference()).string()
 
 
 # mongo::ThreadName isn't a type which is likely to be printed so we don't bother registering it
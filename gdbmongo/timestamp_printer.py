@@ -16,11 +16,12 @@
 """Pretty-printer for the mongo::Timestamp type."""
 
 import ctypes
-import dataclasses
 import struct
+import typing
 
 import gdb
 
+from gdbmongo.gdbutil import gdb_lookup_type
 from gdbmongo.printer_protocol import SupportsToString
 
 
@@ -30,7 +31,10 @@ class c_uint32(ctypes.c_uint32):
     """Wrapper class for ctypes.c_uint32 to avoid implicit conversion to int."""
 
 
-@dataclasses.dataclass
+_TIMESTAMP_STRUCT = struct.Struct("<II")
+"""Format of a mongo::Timestamp stored within a BSON object."""
+
+
 class MongoTimestamp(ctypes.Structure):
     """Structure with a memory layout compatible with that of mongo::Timestamp.
 
@@ -48,23 +52,35 @@ class MongoTimestamp(ctypes.Structure):
     i: c_uint32
     secs: c_uint32
 
+    _fields_ = [("i", c_uint32), ("secs", c_uint32)]
+
     @classmethod
     def unpack_from(cls, buffer: memoryview, /) -> "MongoTimestamp":
         """Read an 8-byte Timestamp starting from the beginning of the given buffer."""
-        fmt = "<II"
-        (inc, seconds) = struct.unpack_from(fmt, buffer)
+        (inc, seconds) = _TIMESTAMP_STRUCT.unpack_from(buffer)
         return cls(secs=c_uint32(seconds), i=c_uint32(inc))
 
+    @classmethod
+    def unpack_many(cls, buffer: memoryview, count: int, /) -> typing.List["MongoTimestamp"]:
+        """Read an array of 8-byte Timestamps starting from the beginning of the given buffer.
+
+        The whole array should be read from the inferior with a single call to
+        gdb.Inferior.read_memory() rather than one call per Timestamp:
+
+        .. code-block:: python
+
+            buffer = gdb.selected_inferior().read_memory(timestamps.address, count * 8)
+            timestamps = MongoTimestamp.unpack_many(buffer, count)
+        """
+        fields = _TIMESTAMP_STRUCT.iter_unpack(buffer[:count * _TIMESTAMP_STRUCT.size])
+        return [cls(secs=c_uint32(seconds), i=c_uint32(inc)) for (inc, seconds) in fields]
+
     def to_value(self) -> gdb.Value:
         """Convert the structure to a gdb.Value of type mongo::Timestamp."""
-        typ = gdb.lookup_type("mongo::Timestamp")
+        typ = gdb_lookup_type("mongo::Timestamp")
         return gdb.Value(memoryview(self), typ)
 
 
-setattr(MongoTimestamp, "_fields_",
-        [(field.name, field.type) for field in dataclasses.fields(MongoTimestamp)])
-
-
 # pylint: disable-next=too-few-public-methods
 class TimestampPrinter(SupportsToString):
     # pylint: disable=missing-function-docstring
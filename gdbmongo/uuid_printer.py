@@ -16,12 +16,11 @@
 """Pretty-printer for the mongo::UUID type."""
 
 import ctypes
-import dataclasses
 import typing
-import uuid
 
 import gdb
 
+from gdbmongo.gdbutil import gdb_lookup_type
 from gdbmongo.printer_protocol import SupportsToString
 
 
@@ -31,7 +30,6 @@ class c_uint8(ctypes.c_uint8):
     """Wrapper class for ctypes.c_uint8 to avoid implicit conversion to int."""
 
 
-@dataclasses.dataclass
 class MongoUUID(ctypes.Structure):
     """Structure with a memory layout compatible with that of mongo::UUID.
 
@@ -51,21 +49,34 @@ class MongoUUID(ctypes.Structure):
     else:
         uuid: c_uint8 * 16
 
+    _fields_ = [("uuid", c_uint8 * 16)]
+
     @classmethod
     def unpack_from(cls, buffer: memoryview, /) -> "MongoUUID":
         """Read a 16-byte UUID starting from the beginning of the given buffer."""
         return cls.from_buffer(buffer)
 
+    @classmethod
+    def unpack_many(cls, buffer: memoryview, count: int, /) -> typing.List["MongoUUID"]:
+        """Read an array of 16-byte UUIDs starting from the beginning of the given buffer.
+
+        The whole array should be read from the inferior with a single call to
+        gdb.Inferior.read_memory() rather than one call per UUID:
+
+        .. code-block:: python
+
+            buffer = gdb.selected_inferior().read_memory(uuids.address, count * 16)
+            uuids = MongoUUID.unpack_many(buffer, count)
+        """
+        # Each element of the ctypes array shares the memory of the given buffer.
+        return list((cls * count).from_buffer(buffer))
+
     def to_value(self) -> gdb.Value:
         """Convert the structure to a gdb.Value of type mongo::UUID."""
-        typ = gdb.lookup_type("mongo::UUID")
+        typ = gdb_lookup_type("mongo::UUID")
         return gdb.Value(memoryview(self), typ)
 
 
-setattr(MongoUUID, "_fields_",
-        [(field.name, field.type) for field in dataclasses.fields(MongoUUID)])
-
-
 # pylint: disable-next=too-few-public-methods
 class UUIDPrinter(SupportsToString):
     # pylint: disable=missing-function-docstring
@@ -74,10 +85,21 @@ class UUIDPrinter(SupportsToString):
     def __init__(self, val: gdb.Value, /) -> None:
         self.val = val
         self.uuid = val["_uuid"]["_M_elems"]
+        address = self.uuid.address
+        self.address = int(address) if address is not None else None
 
     def to_string(self) -> str:
-        data = bytes([int(self.uuid[i]) for i in range(16)])
-        return f'UUID("{uuid.UUID(bytes=data)}")'
+        if self.address is not None:
+            # Reading all 16 bytes at once avoids converting each byte individually.
+            data = bytes(gdb.selected_inferior().read_memory(self.address, 16))
+        else:
+            data = bytes([int(self.uuid[i]) for i in range(16)])
+
+        # Slicing the hex digits directly is equivalent to str(uuid.UUID(bytes=data)) without
+        # constructing the intermediate 128-bit integer.
+        digits = data.hex()
+        return (f'UUID("{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}'
+                f'-{digits[20:]}")')
 
 
 def add_printers(pretty_printer: gdb.printing.RegexpCollectionPrettyPrinter, /) -> None:
@@ -34,6 +34,7 @@ from gdb._inferiorthread import selected_thread as selected_thread
 from gdb._objfile import Objfile as Objfile
 from gdb._objfile import current_objfile as current_objfile
 from gdb._progspace import Progspace as Progspace
+from gdb._symbol import SYMBOL_STRUCT_DOMAIN as SYMBOL_STRUCT_DOMAIN
 from gdb._symbol import Symbol as Symbol
 from gdb._symbol import lookup_symbol as lookup_symbol
 from gdb._type import Field as Field
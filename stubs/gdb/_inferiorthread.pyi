@@ -59,5 +59,5 @@ class InferiorThread:
         ...
 
 
-def selected_thread() -> InferiorThread:
+def selected_thread() -> typing.Optional[InferiorThread]:
     ...
@@ -30,5 +30,9 @@ class Symbol:
         ...
 
 
-def lookup_symbol(symbol_name: str, /) -> typing.Tuple[typing.Optional[Symbol], bool]:
+SYMBOL_STRUCT_DOMAIN: int
+
+
+def lookup_symbol(symbol_name: str, /, *,
+                  domain: int = ...) -> typing.Tuple[typing.Optional[Symbol], bool]:
     ...
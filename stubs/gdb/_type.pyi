@@ -104,6 +104,9 @@ class Type:
     def fields(self) -> typing.List[Field]:
         ...
 
+    def array(self, n1: int, n2: typing.Optional[int] = None, /) -> Type:
+        ...
+
     def unqualified(self) -> Type:
         ...
 
@@ -15,12 +15,13 @@
 ###
 """https://sourceware.org/gdb/onlinedocs/gdb/Values-From-Inferior.html"""
 
+import builtins
 import typing
 
 from _typeshed import ReadableBuffer
 
 from gdb._lazy_string import LazyString
-from gdb._type import Type
+from gdb._type import Field, Type
 
 ConstructibleFrom = bool | int | float | str | Value
 
@@ -55,6 +56,10 @@ class Value(typing.SupportsInt, typing.SupportsFloat):
     def __getitem__(self, idx: int) -> Value:
         ...
 
+    @typing.overload
+    def __getitem__(self, field: Field) -> Value:
+        ...
+
     def __lt__(self, other: object) -> bool:
         ...
 
@@ -80,7 +85,11 @@ class Value(typing.SupportsInt, typing.SupportsFloat):
         ...
 
     @property
-    def address(self) -> Value:
+    def address(self) -> typing.Optional[Value]:
+        ...
+
+    @property
+    def bytes(self) -> builtins.bytes:
         ...
 
     @property
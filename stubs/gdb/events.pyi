@@ -17,6 +17,9 @@
 
 import typing
 
+from gdb._objfile import Objfile
+from gdb._progspace import Progspace
+
 NotifyFunc = typing.TypeVar("NotifyFunc", bound=typing.Callable[..., None])
 
 
@@ -37,3 +40,30 @@ class StopEvent:
 
 
 stop: EventRegistry[typing.Callable[[StopEvent], None]]
+
+
+class ContinueEvent:
+    pass
+
+
+cont: EventRegistry[typing.Callable[[ContinueEvent], None]]
+
+
+class NewObjFileEvent:
+
+    @property
+    def new_objfile(self) -> Objfile:
+        ...
+
+
+new_objfile: EventRegistry[typing.Callable[[NewObjFileEvent], None]]
+
+
+class ClearObjFilesEvent:
+
+    @property
+    def progspace(self) -> Progspace:
+        ...
+
+
+clear_objfiles: EventRegistry[typing.Callable[[ClearObjFilesEvent], None]]
@@ -14,3 +14,5 @@
 # limitations under the License.
 ###
 """https://github.com/PyCQA/pylint"""
+
+__version__: str
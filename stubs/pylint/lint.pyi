@@ -18,8 +18,19 @@
 import typing
 
 
+class LinterConfig(typing.Protocol):
+
+    @property
+    def jobs(self) -> int:
+        ...
+
+
 class Linter(typing.Protocol):
 
+    @property
+    def config(self) -> LinterConfig:
+        ...
+
     @property
     def msg_status(self) -> int:
         ...
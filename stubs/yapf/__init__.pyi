@@ -17,6 +17,8 @@
 
 import typing
 
+__version__: str
+
 
 def main(argv: typing.List[str], /) -> int:
     ...
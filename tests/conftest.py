@@ -0,0 +1,77 @@
+###
+# Copyright 2022-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+"""Configuration shared by the test files."""
+
+import typing
+
+import pytest
+
+
+class PassedChecksCache:
+    """Remembers the inputs with which a check last passed so it may be skipped when they are
+    unchanged.
+
+    The pytest.Config.cache attribute is missing entirely when the cacheprovider plugin is disabled,
+    in which case nothing is remembered.
+    """
+
+    def __init__(self, config: pytest.Config, /) -> None:
+        self._cache: typing.Optional[pytest.Cache] = getattr(config, "cache", None)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the pytest cache is available."""
+        return self._cache is not None
+
+    def get(self, name: str, default: typing.Any, /) -> typing.Any:
+        """Return the inputs stored for the named check, or the default if there are none."""
+        if self._cache is None:
+            return default
+
+        return self._cache.get(f"gdbmongo/{name}", default)
+
+    def set(self, name: str, value: typing.Any, /) -> None:
+        """Store the inputs with which the named check passed."""
+        if self._cache is not None:
+            self._cache.set(f"gdbmongo/{name}", value)
+
+
+@pytest.fixture(scope="session")
+def passed_checks(pytestconfig: pytest.Config) -> PassedChecksCache:
+    """Return the cache of the inputs with which each check last passed."""
+    return PassedChecksCache(pytestconfig)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --run-network command line option."""
+    parser.addoption("--run-network", action="store_true", default=False,
+                     help="run the tests which download files over the network")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the network marker."""
+    config.addinivalue_line("markers", "network: test downloads files over the network")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: typing.List[pytest.Item]) -> None:
+    """Skip the tests marked as network unless the --run-network option was given."""
+    if config.getoption("--run-network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="needs the --run-network option to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
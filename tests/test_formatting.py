@@ -15,41 +15,84 @@
 ###
 """Test file for checking Python formatting."""
 
-import itertools
+import hashlib
 import os
 import pathlib
 import typing
+import warnings
 
-import pytest
+from conftest import PassedChecksCache
+
+# The yapf package imports the lib2to3 package, which emits a PendingDeprecationWarning. The import
+# is done once at module scope rather than on every call to run_yapf().
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", r"lib2to3 package is deprecated.*", PendingDeprecationWarning)
+    import yapf
 
 
-def find_pyfiles() -> typing.Iterator[pathlib.Path]:
+def find_pyfiles() -> typing.Iterator[str]:
     """Return an iterator of the files to format."""
-    return itertools.chain(
-        pathlib.Path("../gdbmongo").rglob("*.py"),
-        pathlib.Path("../gdbmongo").rglob("*.pyi"),
-        pathlib.Path("../stubs").rglob("*.pyi"),
-        pathlib.Path("../tests").rglob("*.py"))
+    yield from scan_pyfiles("../gdbmongo", (".py", ".pyi"))
+    yield from scan_pyfiles("../stubs", (".pyi", ))
+    yield from scan_pyfiles("../tests", (".py", ))
+
+
+def scan_pyfiles(directory: str, suffixes: typing.Tuple[str, ...], /) -> typing.Iterator[str]:
+    """Return an iterator of the files within the directory and its subdirectories which end in one
+    of the given suffixes.
+
+    Unlike pathlib.Path.rglob(), os.scandir() doesn't construct a pathlib.Path object for every
+    directory entry and each tree is only walked once for all of the suffixes.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_pyfiles(entry.path, suffixes)
+            elif entry.name.endswith(suffixes):
+                yield entry.path
 
 
-def run_yapf(fix: bool) -> bool:
+def run_yapf(fix: bool, pyfiles: typing.Sequence[str]) -> bool:
     """Return True if YAPF reports no further changes are needed, and return False otherwise.
 
     This function always returns True when fix == True.
     """
-    # We import the module here to suppress the PendingDeprecationWarning.
-    # pylint: disable-next=import-outside-toplevel
-    import yapf
+    if not pyfiles:
+        # yapf.main() would otherwise read from stdin.
+        return True
+
+    args = ["", "--in-place" if fix else "--diff", "--verbose"]
 
-    ret = yapf.main([
-        "",
-        "--in-place" if fix else "--diff",
-        "--verbose",
-    ] + [str(path) for path in find_pyfiles() if path != pathlib.Path("../gdbmongo/_version.py")])
+    # YAPF formats each file independently so the files are spread across a pool of worker
+    # processes. Setting YAPF_SERIAL=1 formats them one at a time in the current process instead.
+    if len(pyfiles) > 1 and not strtobool(os.environ.get("YAPF_SERIAL", "0")):
+        args.append("--parallel")
+
+    ret = yapf.main([*args, *pyfiles])
 
     return ret == 0 or fix
 
 
+def file_digest(path: str, /) -> str:
+    """Return a digest of the file's contents."""
+    with open(path, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def yapf_config_digest() -> str:
+    """Return a digest of the YAPF version and the style configuration it is run with."""
+    hasher = hashlib.blake2b(yapf.__version__.encode(), digest_size=16)
+    hasher.update(pathlib.Path("../pyproject.toml").read_bytes())
+    return hasher.hexdigest()
+
+
+TRUTH_VALUES = {
+    **dict.fromkeys(("y", "yes", "t", "true", "on", "1"), True),
+    **dict.fromkeys(("n", "no", "f", "false", "off", "0"), False),
+}
+"""Mapping from the lowercase string representations of truth accepted by strtobool()."""
+
+
 # Adapted from the definition for distutils.util.strtobool() in Python 3.11.1 to accommodate the
 # deprecation of the distutils module (PEP 632).
 def strtobool(val: str) -> bool:
@@ -61,18 +104,33 @@ def strtobool(val: str) -> bool:
     Raises a ValueError if `val` is any other value.
     """
     val = val.lower()
-    if val in ("y", "yes", "t", "true", "on", "1"):
-        return True
+    if (ret := TRUTH_VALUES.get(val)) is None:
+        raise ValueError(f"Invalid truth value: {val!r}")
 
-    if val in ("n", "no", "f", "false", "off", "0"):
-        return False
+    return ret
 
-    raise ValueError(f"Invalid truth value: {val!r}")
 
+def test_formatting(passed_checks: PassedChecksCache) -> None:
+    """Check code and tests for Python formatting errors.
 
-@pytest.mark.filterwarnings(r"ignore:lib2to3 package is deprecated.*:PendingDeprecationWarning")
-def test_formatting() -> None:
-    """Check code and tests for Python formatting errors."""
+    Files whose contents are unchanged since they last passed the check are skipped when the pytest
+    cache is available.
+    """
     should_fix = strtobool(os.environ.get("TOX_YAPF_FIX", "0"))
-    format_ok = run_yapf(should_fix)
+    pyfiles = [path for path in find_pyfiles() if path != "../gdbmongo/_version.py"]
+    digests = {path: file_digest(path) for path in pyfiles}
+
+    config_digest = yapf_config_digest()
+    formatted: typing.Dict[str, str] = {}
+
+    cached = passed_checks.get("formatted-files", {})
+    if cached.get("config") == config_digest:
+        formatted = cached.get("files", {})
+
+    changed = [path for path in pyfiles if formatted.get(path) != digests[path]]
+    format_ok = run_yapf(should_fix, changed)
+
+    if format_ok and not should_fix:
+        passed_checks.set("formatted-files", {"config": config_digest, "files": digests})
+
     assert format_ok, "Changes are needed to address formatting issues; try running `tox -e format`"
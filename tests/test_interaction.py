@@ -16,14 +16,9 @@
 """Test file for the interaction.py module."""
 
 import subprocess
-import tempfile
 import typing
 
-FAKE_GDBINIT = """\
-set confirm off
-set python print-stack full
-
-python
+FAKE_GDBINIT_PYTHON = """\
 import gdbmongo
 
 # Skip importing the libstdc++ GDB pretty printers. This enables running GDB with an executable file
@@ -37,9 +32,17 @@ init_mock()
 del init_mock
 
 gdbmongo.register_printers()
-end
 """
 
+FAKE_GDBINIT = (
+    "set confirm off",
+    "set python print-stack full",
+    # The python command only accepts a single line of Python code when it is given as an argument.
+    # The multi-line script is instead run through exec() within GDB's __main__ module.
+    f"python exec({FAKE_GDBINIT_PYTHON!r})",
+)
+"""GDB commands to run on startup in place of a .gdbinit file."""
+
 
 def run_interactive_gdb(
         input_commands: str, /, *,
@@ -63,20 +66,17 @@ def run_interactive_gdb(
     # because the index cache directory isn't needed for these Python tests.
     env = dict(PYTHONPATH="..", XDG_CACHE_HOME="/dev/null")
 
-    with tempfile.NamedTemporaryFile(mode="wt") as command_file:
-        command_file.write(FAKE_GDBINIT)
-        command_file.flush()
-
-        argv = [
-            "/opt/mongodbtoolchain/v4/bin/gdb", "--silent", "-nx", "--init-command",
-            command_file.name
-        ]
+    # Each command is passed with --init-eval-command rather than written to a temporary file for
+    # --init-command. Both options run the commands before the executable file is loaded.
+    argv = ["/opt/mongodbtoolchain/v4/bin/gdb", "--silent", "-nx"]
+    for command in FAKE_GDBINIT:
+        argv += ["--init-eval-command", command]
 
-        if executable is not None:
-            argv.append(executable)
+    if executable is not None:
+        argv.append(executable)
 
-        return subprocess.run(argv, text=True, capture_output=True, check=True,
-                              input=input_commands, env=env)
+    return subprocess.run(argv, text=True, capture_output=True, check=True, input=input_commands,
+                          env=env)
 
 
 def test_gdb_at_prompt_no_target() -> None:
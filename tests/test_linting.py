@@ -15,27 +15,84 @@
 ###
 """Test file for checking Python linting."""
 
+import concurrent.futures
+import contextlib
+import hashlib
+import io
 import logging
+import os
+import pathlib
+import subprocess
 import sys
+import typing
 import unittest.mock
+import warnings
 
 import mypy.api
 import pydocstyle.cli
+import pylint
 import pylint.lint
 import pytest
 
+from conftest import PassedChecksCache
 
-@pytest.mark.filterwarnings(r"ignore:In astroid 3.0.0 NodeNG.statement\(\).*:DeprecationWarning")
-def test_linting() -> None:
-    """Check code and tests for Python linting errors."""
-    runner = pylint.lint.Run(
-        ["--rcfile=../pyproject.toml", "../gdbmongo/", "../stubs/", "../tests/"], exit=False)
-    lint_ok = runner.linter.msg_status == 0
-    assert lint_ok, "Changes are needed to address linting issues"
+PRE_COMMIT_MAX_FILES = 10
+"""Largest number of changed files for which pylint only checks those files under pre-commit."""
 
 
-def test_typechecking() -> None:
-    """Check code and tests for Python type errors."""
+def changed_pyfiles() -> typing.List[str]:
+    """Return the Python files under gdbmongo/, stubs/, and tests/ which differ from the HEAD
+    commit.
+    """
+    result = subprocess.run(["git", "diff", "--name-only", "--diff-filter=ACMR", "HEAD"], cwd="..",
+                            capture_output=True, text=True, check=False)
+
+    return [
+        f"../{path}" for path in result.stdout.splitlines()
+        if path.startswith(("gdbmongo/", "stubs/", "tests/")) and path.endswith((".py", ".pyi"))
+    ]
+
+
+def check_linting() -> bool:
+    """Return True if pylint finds no issues in the code and tests, and return False otherwise."""
+    paths = ["../gdbmongo/", "../stubs/", "../tests/"]
+
+    # pylint is kept to a single job within a pytest-xdist worker so the number of processes doesn't
+    # multiply, and under pre-commit where spawning its own workers costs more than checking the few
+    # changed files.
+    jobs = 1 if "PRE_COMMIT" in os.environ or "PYTEST_XDIST_WORKER" in os.environ else 0
+
+    # Starting up pylint dominates the time spent checking the few files touched by a commit. Only
+    # those files are checked when running under pre-commit. Everywhere else the full check runs so
+    # the duplicate-code and cyclic-import checks see the whole project.
+    if "PRE_COMMIT" in os.environ:
+        if 0 < len(changed := changed_pyfiles()) <= PRE_COMMIT_MAX_FILES:
+            paths = changed
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", r"In astroid 3.0.0 NodeNG.statement\(\).*",
+                                DeprecationWarning)
+
+        runner = pylint.lint.Run(["--rcfile=../pyproject.toml", f"--jobs={jobs}", *paths],
+                                 exit=False)
+        lint_ok = runner.linter.msg_status == 0
+
+        # pylint builds the import graph separately within each worker process when running in
+        # parallel and so the cyclic-import check never sees the whole project. We run it serially
+        # on its own only in that case. A single-job run, which is always the case under
+        # pytest-xdist, has already done the cyclic-import check.
+        if jobs != 1 and runner.linter.config.jobs > 1:
+            runner = pylint.lint.Run([
+                "--rcfile=../pyproject.toml", "--jobs=1", "--disable=all", "--enable=cyclic-import",
+                *paths
+            ], exit=False)
+            lint_ok = lint_ok and runner.linter.msg_status == 0
+
+    return lint_ok
+
+
+def check_typechecking() -> bool:
+    """Return True if mypy finds no issues in the code and tests, and return False otherwise."""
     (normal_report, error_report, exit_status) = mypy.api.run(
         ["--config-file=../pyproject.toml", "../gdbmongo/", "../stubs/", "../tests/"])
 
@@ -47,22 +104,127 @@ def test_typechecking() -> None:
         print("\nError report:\n", file=sys.stderr)
         print(error_report, file=sys.stderr)
 
-    typecheck_ok = exit_status == 0
-    assert typecheck_ok, "Changes are needed to address type annotation issues"
+    return exit_status == 0
 
 
-def test_docstrings() -> None:
-    """Check docstrings for Python style errors."""
+def check_docstrings() -> bool:
+    """Return True if pydocstyle finds no issues in the docstrings, and return False otherwise."""
     with unittest.mock.patch(
             "sys.argv",
         ["", "--config=../pyproject.toml", "../gdbmongo/", "../stubs/", "../tests/"]):
         logger = logging.getLogger("pydocstyle.utils")
-        # pydocstyle automatically configures its logger to level DEBUG. This leads pytest to
-        # capture and display a large volume of log messages whenever there is a test assertion
-        # failure. We override logging.Logger.setLevel() on pydocstyle's logger to prevent this.
-        # Note that pytest automatically captures any messages at level WARNING and above.
+        # pydocstyle automatically configures its logger to level DEBUG. This leads to a large
+        # volume of log messages being displayed whenever there is a test assertion failure. We
+        # override logging.Logger.setLevel() on pydocstyle's logger to prevent this.
         with unittest.mock.patch.object(logger, "setLevel"):
             exit_code = pydocstyle.cli.run_pydocstyle()
 
-    docstrings_ok = exit_code == 0
+    return exit_code == 0
+
+
+STATIC_CHECKS: typing.Dict[str, typing.Callable[[], bool]] = {
+    "test_linting": check_linting,
+    "test_typechecking": check_typechecking,
+    "test_docstrings": check_docstrings,
+}
+"""Mapping from the name of each test case to the static check it reports on."""
+
+StaticCheckFutures = typing.Dict[str, "concurrent.futures.Future[typing.Tuple[bool, str]]"]
+
+
+def lint_inputs_digest() -> str:
+    """Return a digest of the pylint version, its configuration, and the metadata of the files it
+    checks.
+
+    The size and modification time of each file are used in place of its contents so that computing
+    the digest remains cheap.
+    """
+    hasher = hashlib.blake2b(pylint.__version__.encode(), digest_size=16)
+    paths = [
+        path for directory in ("../gdbmongo", "../stubs", "../tests")
+        for path in pathlib.Path(directory).rglob("*") if path.suffix in (".py", ".pyi")
+    ]
+
+    for path in [pathlib.Path("../pyproject.toml"), *sorted(paths)]:
+        stat = path.stat()
+        hasher.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+
+    return hasher.hexdigest()
+
+
+def run_static_check(check: typing.Callable[[], bool], /) -> typing.Tuple[bool, str]:
+    """Call the static check and return its result along with its stdout and stderr output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        check_ok = check()
+
+    return (check_ok, output.getvalue())
+
+
+@pytest.fixture(scope="module", name="static_checks")
+def fixture_static_checks(request: pytest.FixtureRequest,
+                          passed_checks: PassedChecksCache) -> typing.Iterator[StaticCheckFutures]:
+    """Start the static checks for all of the selected test cases concurrently.
+
+    pylint, mypy, and pydocstyle each analyze the same files independently of one another. Running
+    them in parallel reduces the time spent from the sum of their running times to roughly that of
+    the slowest one. Worker processes are used rather than threads because the checks are CPU-bound
+    and modify process-wide state such as sys.argv.
+    """
+    selected = {
+        item.originalname
+        for item in request.session.items if isinstance(item, pytest.Function)
+    }
+
+    futures: StaticCheckFutures = {}
+
+    # pylint is skipped when none of the files it checks have changed since it last passed.
+    lint_digest = lint_inputs_digest()
+    lint_unchanged = passed_checks.get("lint-ok", None) == lint_digest
+    if lint_unchanged and "test_linting" in selected:
+        selected.remove("test_linting")
+        futures["test_linting"] = concurrent.futures.Future()
+        futures["test_linting"].set_result((True, ""))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(STATIC_CHECKS)) as executor:
+        futures.update({
+            name: executor.submit(run_static_check, check)
+            for (name, check) in STATIC_CHECKS.items() if name in selected
+        })
+
+        yield futures
+
+    # A passing run under pre-commit may have only checked the changed files and so says nothing
+    # about the rest of the project.
+    lint_future = futures.get("test_linting")
+    if not passed_checks.enabled or lint_future is None or "PRE_COMMIT" in os.environ:
+        return
+
+    if lint_future.exception() is None:
+        if lint_future.result()[0]:
+            passed_checks.set("lint-ok", lint_digest)
+
+
+def report_static_check(static_checks: StaticCheckFutures, name: str, /) -> bool:
+    """Wait for the static check to finish, replay its output, and return its result."""
+    (check_ok, output) = static_checks[name].result()
+    print(output, end="")
+    return check_ok
+
+
+def test_linting(static_checks: StaticCheckFutures) -> None:
+    """Check code and tests for Python linting errors."""
+    lint_ok = report_static_check(static_checks, "test_linting")
+    assert lint_ok, "Changes are needed to address linting issues"
+
+
+def test_typechecking(static_checks: StaticCheckFutures) -> None:
+    """Check code and tests for Python type errors."""
+    typecheck_ok = report_static_check(static_checks, "test_typechecking")
+    assert typecheck_ok, "Changes are needed to address type annotation issues"
+
+
+def test_docstrings(static_checks: StaticCheckFutures) -> None:
+    """Check docstrings for Python style errors."""
+    docstrings_ok = report_static_check(static_checks, "test_docstrings")
     assert docstrings_ok, "Changes are needed to address docstring issues"
@@ -17,6 +17,7 @@
 
 import pathlib
 import sys
+import types
 import typing
 import unittest.mock
 
@@ -24,7 +25,19 @@ import pytest
 
 from gdbmongo.detect_toolchain import ToolchainInfo
 import gdbmongo.stdlib_printers
-from gdbmongo.stdlib_printers_loader import resolve_import
+from gdbmongo.stdlib_printers_loader import clear_cache, resolve_import
+
+# The gdb.libstdcxx.v6 package imports the gdb module and accesses arbitrary attributes of it while
+# being executed, which a MagicMock accommodates. The same MagicMock is shared by all of the test
+# cases rather than a new one being created for each.
+GDB_STUB = unittest.mock.MagicMock()
+
+
+@pytest.fixture
+def reset_gdb_stub() -> typing.Generator[None, None, None]:
+    """Forget the calls, return values, and side effects recorded on GDB_STUB by the test case."""
+    yield
+    GDB_STUB.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
@@ -33,6 +46,23 @@ def unload_libstdcxx_printers() -> typing.Generator[None, None, None]:
     yield
     sys.modules.pop("gdb.libstdcxx.v6", None)
     sys.modules.pop("gdb.libstdcxx.v6.printers", None)
+    clear_cache()
+
+
+ResolvedImport = typing.Tuple[types.ModuleType, typing.Callable[[], None]]
+
+
+@pytest.fixture(scope="class")
+def resolved(request: pytest.FixtureRequest) -> None:
+    """Load the gdb.libstdcxx.v6 package once for all of the test cases in the class and store it as
+    the `resolved` class attribute.
+    """
+    with unittest.mock.patch.dict("sys.modules", gdb=GDB_STUB):
+        request.cls.resolved = resolve_import(request.cls.toolchain_info)
+
+    # The stored module remains usable after being forgotten here. The test cases which check the
+    # caching behavior of resolve_import() itself still start out with nothing loaded.
+    clear_cache()
 
 
 @pytest.mark.parametrize(("toolchain_info", ), (
@@ -45,8 +75,8 @@ def unload_libstdcxx_printers() -> typing.Generator[None, None, None]:
                       pathlib.Path("/opt/mongodbtoolchain/v4/share/gcc-11.3.0/python")),
         id="v4/gcc-11.2.0"),
 ))
-@pytest.mark.usefixtures("unload_libstdcxx_printers")
-@unittest.mock.patch.dict("sys.modules", gdb=unittest.mock.MagicMock())
+@pytest.mark.usefixtures("reset_gdb_stub", "unload_libstdcxx_printers")
+@unittest.mock.patch.dict("sys.modules", gdb=GDB_STUB)
 def test_can_load_module_from_toolchain(toolchain_info: ToolchainInfo) -> None:
     """Check that the gdb.libstdcxx.v6 package can be loaded without error for the corresponding
     version of the MongoDB toolchain.
@@ -55,25 +85,39 @@ def test_can_load_module_from_toolchain(toolchain_info: ToolchainInfo) -> None:
     assert module.register_libstdcxx_printers is not None
 
 
-@pytest.mark.usefixtures("unload_libstdcxx_printers")
-@unittest.mock.patch.dict("sys.modules", gdb=unittest.mock.MagicMock())
+@pytest.mark.usefixtures("resolved", "reset_gdb_stub", "unload_libstdcxx_printers")
+@unittest.mock.patch.dict("sys.modules", gdb=GDB_STUB)
 class TestStdlibPrinters:
     """Container for test cases so each runs with mocks and fixtures applied."""
 
     toolchain_info = ToolchainInfo("GCC: (GNU) 8.5.0",
                                    pathlib.Path("/opt/mongodbtoolchain/v3/share/gcc-8.5.0/python"))
 
+    resolved: ResolvedImport
+
     def test_no_side_effects_from_loading_module(self) -> None:
         """Check that calling resolve_import() won't modify sys.modules automatically."""
         current_modules = frozenset(sys.modules.keys())
         resolve_import(self.toolchain_info)
         assert current_modules == sys.modules.keys()
 
+    def test_module_is_reused_for_same_toolchain(self) -> None:
+        """Check that calling resolve_import() again for the same toolchain doesn't execute the
+        gdb.libstdcxx.v6 package a second time.
+        """
+        (module, _register_module) = resolve_import(self.toolchain_info)
+        (module_again, _register_module) = resolve_import(self.toolchain_info)
+        assert module_again is module
+
+        clear_cache()
+        (module_after_clear, _register_module) = resolve_import(self.toolchain_info)
+        assert module_after_clear is not module
+
     def test_can_import_module_after_registering(self) -> None:
         """Check that the gdb.libstdcxx.v6 module is only available to import after the returned
         register_module() function has been called.
         """
-        (_module, register_module) = resolve_import(self.toolchain_info)
+        (_module, register_module) = self.resolved
         assert "gdb.libstdcxx.v6" not in sys.modules
         assert "gdb.libstdcxx.v6.printers" not in sys.modules
         register_module()
@@ -84,7 +128,7 @@ class TestStdlibPrinters:
         """Check that pretty printer classes are only available to import after the returned
         register_module() function has been called.
         """
-        (_module, register_module) = resolve_import(self.toolchain_info)
+        (_module, register_module) = self.resolved
         with pytest.raises(ModuleNotFoundError, match=r"No module named 'gdb.libstdcxx'"):
             _ = gdbmongo.stdlib_printers.UniquePointerPrinter
         register_module()
@@ -94,7 +138,7 @@ class TestStdlibPrinters:
         """Check that pretty printer classes are only available to list after the returned
         register_module() function has been called.
         """
-        (_module, register_module) = resolve_import(self.toolchain_info)
+        (_module, register_module) = self.resolved
         with pytest.raises(ModuleNotFoundError, match=r"No module named 'gdb.libstdcxx'"):
             dir(gdbmongo.stdlib_printers)
         register_module()